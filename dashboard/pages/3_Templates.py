@@ -241,16 +241,16 @@ def main():
         else:
             logging.debug("Templates already initialized")
             
-        # Criar instância do TemplateManager diretamente
+        # Obter o TemplateManager compartilhado do LLM
         from prompt.template_manager import TemplateManager
-        template_manager = TemplateManager(llm, skip_intent_analysis=True)
-        logging.info("TemplateManager criado com skip_intent_analysis=True")
+        template_manager = TemplateManager.instance(llm, skip_intent_analysis=True)
+        logging.info("TemplateManager compartilhado obtido com skip_intent_analysis=True")
         
         # Initialize other managers with the shared template manager
         category_manager = CategoryManager(template_manager)
-        suggestion_manager = SuggestionManager(llm)
+        suggestion_manager = SuggestionManager(llm, template_manager)
         editor_manager = EditorManager(llm, template_manager)
-        dependency_manager = DependencyManager(llm)
+        dependency_manager = DependencyManager(llm, template_manager)
         export_manager = ExportManager(llm, template_manager)
     
     # Page title with icon
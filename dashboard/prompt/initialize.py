@@ -93,10 +93,10 @@ def register_concept_embedding_template() -> None:
     
     # Register the template
     try:
-        # Add directly to the templates dictionary
+        # Register without schema validation
         template_id = template_data.get('template_id')
         if template_id:
-            manager.templates[template_id] = template_data
+            manager.register_template(template_id, template_data)
             logger.info(f"Template registered: {template_id}")
         else:
             logger.error(f"Template without ID: {template_path}")
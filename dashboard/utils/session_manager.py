@@ -85,23 +85,6 @@ def get_template_manager() -> 'TemplateManager':
     Returns:
         TemplateManager: The shared template manager instance
     """
-    # Check if the templates were initialized in Home.py or if they were already loaded in the session_state
-    templates_already_initialized = 'templates_initialized' in st.session_state and st.session_state.templates_initialized
-    templates_already_loaded = 'tm_templates_loaded' in st.session_state and st.session_state.tm_templates_loaded
-    templates_exist = 'tm_templates' in st.session_state and len(st.session_state.tm_templates) > 0
-    
-    # Set flag to skip analysis if any of the conditions are true
-    skip_analysis = templates_already_initialized or templates_already_loaded or templates_exist
-    
-    # Ensure session state flags are consistent
-    if templates_exist and not templates_already_loaded:
-        st.session_state.tm_templates_loaded = True
-        logger.info("Marking tm_templates_loaded as True since templates exist in session_state")
-        
-    if templates_already_loaded and not templates_already_initialized:
-        st.session_state.templates_initialized = True
-        logger.info("Marking templates_initialized as True since tm_templates_loaded is True")
-    
     if 'template_manager' not in st.session_state:
         # Add root path to sys.path to ensure correct import
         root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
@@ -110,15 +93,17 @@ def get_template_manager() -> 'TemplateManager':
         
         llm = LLMFactory.create_llm()
         
+        # Skip the analysis if the templates were initialized in Home.py or already loaded in the session_state
+        skip_analysis = st.session_state.get('templates_initialized', False) or bool(st.session_state.get('tm_templates'))
+        
         if skip_analysis:
-            logger.info(f"Templates already initialized or loaded, creating TemplateManager without reprocessing")
-            logger.info(f"templates_initialized={templates_already_initialized}, tm_templates_loaded={templates_already_loaded}, templates_exist={templates_exist}")
+            logger.info("Templates already initialized or loaded, creating TemplateManager without reprocessing")
             # Create TemplateManager with flag to avoid reprocessing
-            st.session_state.template_manager = TemplateManager(llm, skip_intent_analysis=True)
+            st.session_state.template_manager = TemplateManager.instance(llm, skip_intent_analysis=True)
             logger.info("TemplateManager initialized with skip_intent_analysis=True")
         else:
             logger.info("Initializing new TemplateManager (templates were not initialized previously)")
-            st.session_state.template_manager = TemplateManager(llm, skip_intent_analysis=False)
+            st.session_state.template_manager = TemplateManager.instance(llm, skip_intent_analysis=False)
             logger.info("TemplateManager initialized with complete processing")
     else:
         logger.debug("Using existing TemplateManager instance")
@@ -9,6 +9,12 @@ from dotenv import load_dotenv
 from .interface import LLMInterface
 import openai
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 class ChatGPTConnector(LLMInterface):
     """Conector para o ChatGPT API."""
     
@@ -56,7 +62,7 @@ class ChatGPTConnector(LLMInterface):
                 ]
             )
             content = response.choices[0].message.content
-            return json.loads(content)
+            return _json_loads(content)
         except Exception as e:
             raise Exception(f"Erro ao gerar conteúdo estruturado: {str(e)}")
     
@@ -77,7 +83,7 @@ class ChatGPTConnector(LLMInterface):
                 ]
             )
             content = response.choices[0].message.content
-            return json.loads(content)
+            return _json_loads(content)
         except Exception as e:
             raise Exception(f"Erro ao analisar texto: {str(e)}")
     
@@ -98,3 +104,23 @@ class ChatGPTConnector(LLMInterface):
             return response.data[0].embedding
         except Exception as e:
             raise Exception(f"Erro ao gerar embeddings: {str(e)}")
+    
+    def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Gera embeddings para vários textos em uma única requisição.
+        
+        Args:
+            texts: Textos para gerar embeddings
+            
+        Returns:
+            Lista de embeddings, na mesma ordem dos textos
+        """
+        if not texts:
+            return []
+        try:
+            response = openai.embeddings.create(
+                input=texts,
+                model="text-embedding-ada-002"
+            )
+            return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+        except Exception as e:
+            raise Exception(f"Erro ao gerar embeddings: {str(e)}")
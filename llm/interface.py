@@ -55,3 +55,17 @@ class LLMInterface(ABC):
             Lista de embeddings
         """
         pass
+    
+    def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Gera embeddings para vários textos.
+        
+        A implementação padrão chama generate_embeddings para cada texto;
+        conectores cujo provedor aceita vários textos por requisição devem sobrescrevê-la.
+        
+        Args:
+            texts: Textos para gerar embeddings
+            
+        Returns:
+            Lista de embeddings, na mesma ordem dos textos
+        """
+        return [self.generate_embeddings(text) for text in texts]
@@ -0,0 +1,35 @@
+"""Shared helpers for the prompt module."""
+
+import re
+from typing import Any, Dict, Tuple
+
+# Template placeholder in the {{variable}} syntax used by the YAML templates
+PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+# Template parameter -> concept keys tried in order, and the default when none is present
+CONCEPT_KEY_MAP: Dict[str, Tuple[Tuple[str, ...], Any]] = {
+    "concept_name": (("concept_name", "name", "label"), ""),
+    "concept_description": (("concept_description", "description"), ""),
+    "concept_type": (("concept_type", "type"), ""),
+    "concept_properties": (("concept_properties", "properties"), {}),
+}
+
+
+def _first(concept: Dict[str, Any], keys: Tuple[str, ...], default: Any) -> Any:
+    """Returns the value of the first key present in the concept."""
+    for key in keys:
+        if key in concept:
+            return concept[key]
+    return default
+
+
+def concept_parameters(concept: Dict[str, Any]) -> Dict[str, Any]:
+    """Maps a concept dictionary to the concept_* template parameters.
+
+    Args:
+        concept: Dictionary with concept information
+
+    Returns:
+        Template parameters, following CONCEPT_KEY_MAP
+    """
+    return {param: _first(concept, keys, default) for param, (keys, default) in CONCEPT_KEY_MAP.items()}
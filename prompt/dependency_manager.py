@@ -1,18 +1,19 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from llm.interface import LLMInterface
 from prompt.template_manager import TemplateManager
 
 class DependencyManager:
     """Template dependency manager."""
     
-    def __init__(self, llm: LLMInterface):
+    def __init__(self, llm: LLMInterface, template_manager: Optional[TemplateManager] = None):
         """Initialize the dependency manager.
         
         Args:
             llm: LLM interface for dependency analysis
+            template_manager: Template manager to reuse (defaults to the shared instance for llm)
         """
         self.llm = llm
-        self.template_manager = TemplateManager(llm)
+        self.template_manager = template_manager or TemplateManager.instance(llm)
     
     def analyze_dependencies(self, template: Dict[str, Any]) -> Dict[str, Any]:
         """Analyzes template dependencies.
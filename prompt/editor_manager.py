@@ -110,23 +110,42 @@ class EditorManager:
         errors = []
         
         # Validate type
-        if original["type"] != updated["type"]:
+        if original["type"] != updated.get("type"):
             errors.append("The template type cannot be changed")
             
-        # Validate variables
-        if len(updated["variables"]) < len(original["variables"]):
+        # Validate variables (renaming a variable also counts as removing it)
+        if not set(original["variables"]).issubset(updated.get("variables") or ()):
             errors.append("Cannot remove existing variables")
             
         # Validate content
-        if not updated["content"]:
+        if not updated.get("content"):
             errors.append("Template content cannot be empty")
             
         # Validate name
-        if not updated["name"]:
+        if not updated.get("name"):
             errors.append("Template name cannot be empty")
             
         return errors
     
+    def is_valid(self, original: Dict[str, Any], updated: Dict[str, Any]) -> bool:
+        """Checks whether changes to a template are valid.
+        
+        Same rules as validate_changes, but returns on the first failure.
+        
+        Args:
+            original: Original template
+            updated: Updated template
+            
+        Returns:
+            True if the changes are valid, False otherwise
+        """
+        return (
+            original["type"] == updated.get("type")
+            and set(original["variables"]).issubset(updated.get("variables") or ())
+            and bool(updated.get("content"))
+            and bool(updated.get("name"))
+        )
+    
     def update_template(self, template_id: str, updated_data: Dict[str, Any]) -> Dict[str, Any]:
         """Updates an existing template.
         
@@ -148,43 +167,51 @@ class EditorManager:
         # Update template
         return self.template_manager.update_template(template_id, updated_data)
     
-    def delete_template(self, template_id: str) -> None:
+    def delete_template(self, template_id: str, use_llm: bool = True) -> None:
         """Deletes a template.
         
         Args:
             template_id: Template ID
+            use_llm: Also ask the LLM for free-form semantic dependencies; the bundled
+                     templates contain no {{template:<id>}} references, so this is
+                     the only check that finds their dependencies
         """
-        # Check dependencies before deleting
-        template = self.template_manager.get_template(template_id)
+        # Check structural dependencies before deleting
+        dependents = self.template_manager.get_dependents(template_id)
+        if dependents:
+            raise Warning(f"Template {template_id} is referenced by: {', '.join(dependents)}")
         
-        # Prepare prompt to check dependencies
-        prompt = f"""
-        Please analyze if this template has dependencies that need to be considered before deletion:
-        
-        Name: {template['name']}
-        Type: {template['type']}
-        Category: {template.get('category', '')}
-        
-        Content:
-        {template['content']}
-        
-        Variables: {template['variables']}
-        
-        Respond in JSON format:
-        {{
-            "dependencies": ["found dependencies"],
-            "warnings": ["important warnings"]
-        }}
-        """
-        
-        # Generate dependency analysis using LLM
-        dependencies = self.llm.generate_structured(prompt)
-        
-        # If there are dependencies, raise a warning
-        if dependencies.get("dependencies"):
-            warnings = dependencies.get("warnings", [])
-            if warnings:
-                raise Warning("\n".join(warnings))
+        if use_llm:
+            template = self.template_manager.get_template(template_id)
+            
+            # Prepare prompt to check dependencies
+            prompt = f"""
+            Please analyze if this template has dependencies that need to be considered before deletion:
+            
+            Name: {template['name']}
+            Type: {template['type']}
+            Category: {template.get('category', '')}
+            
+            Content:
+            {template['content']}
+            
+            Variables: {template['variables']}
+            
+            Respond in JSON format:
+            {{
+                "dependencies": ["found dependencies"],
+                "warnings": ["important warnings"]
+            }}
+            """
+            
+            # Generate dependency analysis using LLM
+            dependencies = self.llm.generate_structured(prompt)
+            
+            # If there are dependencies, raise a warning
+            if dependencies.get("dependencies"):
+                warnings = dependencies.get("warnings", [])
+                if warnings:
+                    raise Warning("\n".join(warnings))
                 
         # Delete template
         self.template_manager.delete_template(template_id)
@@ -1,27 +1,32 @@
-from typing import Dict, List, Any
+import json
+import numpy as np
+from typing import Dict, List, Any, Optional
 from llm.interface import LLMInterface
 from prompt.template_manager import TemplateManager
 
 class EmbeddingManager:
     """Graph embedding manager."""
     
-    def __init__(self, llm: LLMInterface):
+    def __init__(self, llm: LLMInterface, template_manager: Optional[TemplateManager] = None):
         """Initialize the embedding manager.
         
         Args:
             llm: LLM interface for embedding generation
+            template_manager: Template manager to reuse (defaults to the shared instance for llm)
         """
         self.llm = llm
-        self.template_manager = TemplateManager(llm)
+        self.template_manager = template_manager or TemplateManager.instance(llm)
+        # Unit-norm embeddings keyed by concept content, so cosine similarity is a dot product
+        self._normalized_embeddings: Dict[str, np.ndarray] = {}
     
-    def generate_concept_embedding(self, concept: Dict[str, Any]) -> List[float]:
+    def generate_concept_embedding(self, concept: Dict[str, Any]) -> Optional[List[float]]:
         """Generates an embedding for a concept.
         
         Args:
             concept: Dictionary with concept information
             
         Returns:
-            List of floats representing the embedding
+            List of floats representing the embedding, or None if none was generated
         """
         # Use specific template for embedding generation
         return self.template_manager.get_embedding(
@@ -29,6 +34,27 @@ class EmbeddingManager:
             concept
         )
     
+    def _normalized_embedding(self, concept: Dict[str, Any]) -> Optional[np.ndarray]:
+        """Gets the L2-normalized embedding for a concept, generating it once.
+        
+        Args:
+            concept: Dictionary with concept information
+            
+        Returns:
+            Unit-norm numpy vector (all zeros if the embedding has zero norm),
+            or None if no embedding was generated (not cached, so it is retried)
+        """
+        key = json.dumps(concept, sort_keys=True, default=str)
+        vector = self._normalized_embeddings.get(key)
+        if vector is None:
+            embedding = self.generate_concept_embedding(concept)
+            if embedding is None:
+                return None
+            vector = np.asarray(embedding, dtype=float)
+            vector = vector / max(np.linalg.norm(vector), 1e-12)
+            self._normalized_embeddings[key] = vector
+        return vector
+    
     def calculate_similarity(self, embedding1: List[float], embedding2: List[float]) -> float:
         """Calculates the similarity between two embeddings.
         
@@ -40,8 +66,6 @@ class EmbeddingManager:
             Similarity value (0.0 to 1.0)
         """
         # Cosine similarity implementation
-        import numpy as np
-        
         v1 = np.array(embedding1)
         v2 = np.array(embedding2)
         
@@ -54,39 +78,54 @@ class EmbeddingManager:
             
         return dot_product / (norm1 * norm2)
     
-    def find_related_concepts(self, concept: Dict[str, Any], concepts: List[Dict[str, Any]], threshold: float = 0.7) -> List[Dict[str, Any]]:
+    def find_related_concepts(self, concept: Dict[str, Any], concepts: List[Dict[str, Any]], threshold: float = 0.7, top_k: Optional[int] = None) -> List[Dict[str, Any]]:
         """Finds related concepts based on embeddings.
         
         Args:
             concept: Base concept to find related ones
             concepts: List of concepts to compare with
             threshold: Similarity threshold
+            top_k: If set, only the top_k most similar concepts are returned
             
         Returns:
-            List of related concepts
+            List of related concepts, sorted by similarity
+            
+        Raises:
+            ValueError: If no embedding was generated for the base concept
         """
-        # Generate embedding for the base concept
-        base_embedding = self.generate_concept_embedding(concept)
+        base = self._normalized_embedding(concept)
+        if base is None:
+            raise ValueError(f"No embedding generated for concept: {concept.get('id')}")
         
-        related_concepts = []
-        
-        for other_concept in concepts:
-            if other_concept["id"] == concept["id"]:
+        # Concepts without an embedding cannot be related and are skipped
+        others = []
+        vectors = []
+        for c in concepts:
+            if c["id"] == concept["id"]:
                 continue
-                
-            other_embedding = self.generate_concept_embedding(other_concept)
-            similarity = self.calculate_similarity(base_embedding, other_embedding)
-            
-            if similarity >= threshold:
-                related_concepts.append({
-                    "concept": other_concept,
-                    "similarity": similarity
-                })
+            vector = self._normalized_embedding(c)
+            if vector is not None:
+                others.append(c)
+                vectors.append(vector)
+        if not others:
+            return []
+        
+        # Stack the unit-norm embeddings as rows; cosine similarity is then a dot product
+        matrix = np.stack(vectors)
+        sims = matrix @ base
         
-        # Sort by similarity
-        related_concepts.sort(key=lambda x: x["similarity"], reverse=True)
+        # Select rows above the threshold, ranking only the top_k when requested
+        idx_above = np.flatnonzero(sims >= threshold)
+        if top_k is not None and top_k < idx_above.size:
+            part = idx_above[np.argpartition(-sims[idx_above], top_k)[:top_k]]
+            selected = part[np.argsort(-sims[part], kind="stable")]
+        else:
+            selected = idx_above[np.argsort(-sims[idx_above], kind="stable")]
         
-        return related_concepts
+        return [
+            {"concept": others[i], "similarity": float(sims[i])}
+            for i in selected
+        ]
     
     def generate_semantic_relationships(self, concept: Dict[str, Any], concepts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Generates semantic relationships between concepts.
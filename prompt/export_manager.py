@@ -3,6 +3,23 @@ from typing import Dict, List, Any
 from llm.interface import LLMInterface
 from prompt.template_manager import TemplateManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _orjson_dumps(data: Dict[str, Any]) -> str:
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+
+def _json_dumps(data: Dict[str, Any]) -> str:
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+# Serializer for export files, picked once at import time
+_dumps = _orjson_dumps if orjson is not None else _json_dumps
+
 class ExportManager:
     """Template export and import manager."""
     
@@ -46,39 +63,44 @@ class ExportManager:
         
         return export_data
     
-    def _get_dependencies(self, template_id: str) -> List[Dict[str, Any]]:
+    def _get_dependencies(self, template_id: str, use_llm: bool = True) -> List[Dict[str, Any]]:
         """Gets dependent templates.
         
         Args:
             template_id: Template ID
+            use_llm: Also ask the LLM for free-form semantic dependencies; the bundled
+                     templates contain no {{template:<id>}} references, so this is
+                     the only check that finds their dependencies
             
         Returns:
             List of dependent templates
         """
-        # Prepare prompt to find dependencies
-        prompt = f"""
-        Please find all templates that directly depend on this template:
+        dependency_ids = self.template_manager.get_dependents(template_id)
         
-        ID: {template_id}
-        
-        List only the IDs of the dependent templates.
-        Respond in JSON format:
-        {{
-            "dependencies": ["id1", "id2", "id3"]
-        }}
-        """
-        
-        # Generate analysis using LLM
-        dependencies = self.llm.generate_structured(prompt)
+        if use_llm:
+            # Prepare prompt to find dependencies
+            prompt = f"""
+            Please find all templates that directly depend on this template:
+            
+            ID: {template_id}
+            
+            List only the IDs of the dependent templates.
+            Respond in JSON format:
+            {{
+                "dependencies": ["id1", "id2", "id3"]
+            }}
+            """
+            
+            # Generate analysis using LLM
+            dependencies = self.llm.generate_structured(prompt)
+            dependency_ids += [d for d in dependencies.get("dependencies", []) if d not in dependency_ids]
         
         # Get details of dependent templates
         dependent_templates = []
-        for dep_id in dependencies["dependencies"]:
-            try:
-                template = self.template_manager.get_template(dep_id)
+        for dep_id in dependency_ids:
+            template = self.template_manager.get_template(dep_id)
+            if template is not None:
                 dependent_templates.append(template)
-            except:
-                continue
         
         return dependent_templates
     
@@ -101,15 +123,21 @@ class ExportManager:
         if export_data["metadata"]["version"] != "1.0":
             raise ValueError("Unsupported template version")
         
-        # Import main template
-        imported_template = self.template_manager.create_template(export_data["template"])
+        # Import main template; importing it again updates the existing one
+        template_data = export_data["template"]
+        if self.template_manager.exists(template_data.get("id")):
+            imported_template = self.template_manager.update_template(template_data["id"], template_data)
+        else:
+            imported_template = self.template_manager.create_template(template_data)
         
         # Import dependencies if they exist
         if "dependencies" in export_data:
             for dep in export_data["dependencies"]:
+                if self.template_manager.exists(dep.get("id")):
+                    continue
                 try:
                     self.template_manager.create_template(dep)
-                except:
+                except ValueError:
                     continue
         
         return imported_template
@@ -138,7 +166,7 @@ class ExportManager:
                 return False
             
             return True
-        except:
+        except (json.JSONDecodeError, KeyError, TypeError):
             return False
     
     def generate_export_file(self, template_id: str, include_dependencies: bool = True) -> str:
@@ -159,6 +187,6 @@ class ExportManager:
         filename = f"{template['name'].replace(' ', '_')}_template_export.json"
         
         # Convert to formatted JSON
-        json_content = json.dumps(export_data, indent=2, ensure_ascii=False)
+        json_content = _dumps(export_data)
         
         return json_content, filename
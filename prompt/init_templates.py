@@ -90,10 +90,10 @@ def register_concept_embedding_template(manager) -> None:
     
     # Registrar o template
     try:
-        # Adicionar diretamente ao dicionário de templates
+        # Registrar sem validação de schema
         template_id = template_data.get('template_id')
         if template_id:
-            manager.templates[template_id] = template_data
+            manager.register_template(template_id, template_data)
             logger.info(f"Template registrado: {template_id}")
         else:
             logger.error(f"Template sem ID: {template_path}")
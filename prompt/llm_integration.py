@@ -1,7 +1,11 @@
+import logging
 from typing import Dict, Any, List
 from llm.interface import LLMInterface
+from prompt.common import PLACEHOLDER_RE
 from prompt.manager import PromptManager
 
+logger = logging.getLogger(__name__)
+
 class LLMPromptManager(PromptManager):
     """Extension of PromptManager that integrates with LLM."""
     
@@ -67,9 +71,6 @@ class LLMPromptManager(PromptManager):
             List of floats representing the embedding
         """
         try:
-            import logging
-            logger = logging.getLogger(__name__)
-            
             # Manually replace variables in the template
             filled_template = template_content
             for key, value in parameters.items():
@@ -78,19 +79,18 @@ class LLMPromptManager(PromptManager):
                     # Convert value to string if not None
                     str_value = str(value) if value is not None else ""
                     filled_template = filled_template.replace(placeholder, str_value)
-                    logger.info(f"Replaced {placeholder} with {str_value[:30]}...")
+                    # Lazy %-formatting: nothing is built per variable unless DEBUG is on
+                    logger.debug("Replaced %s with %.30s...", placeholder, str_value)
             
             # Check for any remaining placeholders
-            import re
-            placeholders = re.findall(r'\{\{(\w+)\}\}', filled_template)
-            if placeholders:
-                logger.warning(f"Unreplaced placeholders: {placeholders}")
+            if logger.isEnabledFor(logging.WARNING):
+                placeholders = PLACEHOLDER_RE.findall(filled_template)
+                if placeholders:
+                    logger.warning(f"Unreplaced placeholders: {placeholders}")
             
             # Generate embedding using LLM
-            logger.info(f"Generating embedding for text: {filled_template[:100]}...")
+            logger.debug("Generating embedding for text: %.100s...", filled_template)
             return self.llm.generate_embeddings(filled_template)
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.error(f"Error generating embedding: {str(e)}")
             return []
@@ -12,12 +12,40 @@ import sys
 import json
 import yaml
 import datetime
-from typing import Dict, List, Any, Optional, Union
+import copy
+import functools
+import hashlib
+import random
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Any, Optional, Union
 from string import Formatter
 
-# Importar o conector ChatGPT
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from jinja2 import Environment, Template
+except ImportError:
+    Environment = Template = None
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YAML_LOADER
+except ImportError:
+    from yaml import SafeLoader as _YAML_LOADER
+
+# Make the llm package importable; ChatGPTConnector is imported on first use (see PromptManager.llm)
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from llm.chatgpt import ChatGPTConnector
 
 from .validator import PromptValidator
 
@@ -33,6 +61,229 @@ class Singleton(type):
 
 logger = logging.getLogger(__name__)
 
+# Shared Jinja2 environment used to compile the templates rendered by _fill_template
+_JINJA_ENV = Environment(autoescape=False) if Environment is not None else None
+
+@functools.lru_cache(maxsize=256)
+def _compile_template(template_text: str) -> "Template":
+    """
+    Compiles a Jinja2 template, memoized by its source text.
+    
+    Args:
+        template_text: Template text with placeholders
+        
+    Returns:
+        Compiled Jinja2 template
+    """
+    if _JINJA_ENV is None:
+        raise ImportError("jinja2 is required to fill templates")
+    return _JINJA_ENV.from_string(template_text)
+
+@functools.lru_cache(maxsize=256)
+def _parse_format_string(template_str: str) -> Optional[tuple]:
+    """
+    Pre-parses a str.format template into (literal, field, format_spec) parts.
+    
+    Args:
+        template_str: Template string using {field} placeholders
+        
+    Returns:
+        Tuple of parts, or None if the template needs the full str.format
+        machinery (conversions, attribute/index access, nested specs)
+    """
+    parts = []
+    for literal, field, spec, conversion in Formatter().parse(template_str):
+        if field is not None and (
+            conversion or not field.isidentifier() or (spec and "{" in spec)
+        ):
+            return None
+        parts.append((literal, field, spec or ""))
+    return tuple(parts)
+
+# JSON codec for template files and their cached copies (orjson when installed)
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+    
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+# Dimension of the simulated embedding fallback
+_FALLBACK_EMBEDDING_DIM = 32
+
+# Per-thread numpy Generator for the fallback; Generators are not safe to share across threads
+_rng_local = threading.local()
+
+def _fallback_embedding() -> List[float]:
+    """
+    Generates a random embedding used when no LLM connector is available.
+    
+    Returns:
+        List of floats in [-1.0, 1.0)
+    """
+    if np is not None:
+        rng = getattr(_rng_local, "rng", None)
+        if rng is None:
+            rng = _rng_local.rng = np.random.default_rng()
+        return rng.uniform(-1.0, 1.0, _FALLBACK_EMBEDDING_DIM).tolist()
+    return [random.uniform(-1.0, 1.0) for _ in range(_FALLBACK_EMBEDDING_DIM)]
+
+def _precompile_template(template_data: Dict[str, Any]) -> None:
+    """
+    Warms the parse and compile caches for a template so the first fill is cheap.
+    
+    Args:
+        template_data: Template dictionary
+    """
+    template_text = template_data.get("template")
+    if not isinstance(template_text, str):
+        return
+    try:
+        _parse_format_string(template_text)
+        if _JINJA_ENV is not None:
+            _compile_template(template_text)
+    except Exception as e:
+        # Reported again by _fill_template if the template is actually used
+        logger.debug("Could not precompile template %s: %s", template_data.get('template_id'), e)
+
+# Maximum number of LLM results kept by PromptManager's result cache
+_RESULT_CACHE_SIZE = 1024
+
+# LLM connector method and log label for each kind of generated result
+_LLM_CALLS = {
+    "text": ("generate_text", "content"),
+    "structured": ("generate_structured", "structured content"),
+    "embedding": ("generate_embeddings", "embedding"),
+}
+
+def _cache_by_default(cache_enabled: Optional[bool], temperature: float) -> bool:
+    """
+    Resolves whether a sampled LLM result may be served from the result cache.
+    
+    Args:
+        cache_enabled: Explicit choice of the caller, or None for the default
+        temperature: Sampling temperature of the request
+        
+    Returns:
+        The explicit choice, otherwise True only for deterministic (temperature 0) requests
+    """
+    if cache_enabled is None:
+        return temperature == 0
+    return cache_enabled
+
+def _identity(value: Any) -> Any:
+    return value
+
+# (to_cache, from_cache) converters keeping cached results safe from caller mutation
+_CACHE_CODECS = {
+    "text": (_identity, _identity),
+    "structured": (copy.deepcopy, copy.deepcopy),
+    "embedding": (tuple, list),
+}
+
+class _TemplateUnavailable(ValueError):
+    """Raised when a template is missing or has no 'template' field."""
+
+# File extensions recognized as templates by load_templates
+_TEMPLATE_EXTENSIONS = frozenset({".yaml", ".yml", ".json"})
+
+# Directory (inside the templates directory) holding JSON copies of parsed YAML templates
+_JSON_CACHE_DIR = ".cache"
+
+# Suffix of the JSON copies; changed whenever older copies must no longer be read
+_JSON_CACHE_SUFFIX = ".v2.json"
+
+def _load_template_file(filepath: str, ext: str) -> Any:
+    """
+    Loads a template file, using a JSON copy of YAML templates when it is up to date.
+    
+    Args:
+        filepath: Path to the template file
+        ext: Lower-cased file extension
+        
+    Returns:
+        Parsed template data
+    """
+    if ext == ".json":
+        with open(filepath, 'rb') as f:
+            return _json_loads(f.read())
+    
+    directory, filename = os.path.split(filepath)
+    cache_path = os.path.join(directory, _JSON_CACHE_DIR, filename + _JSON_CACHE_SUFFIX)
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(filepath):
+            with open(cache_path, 'rb') as f:
+                return _json_loads(f.read())
+    except (OSError, ValueError):
+        pass
+    
+    with open(filepath, 'r', encoding='utf-8') as f:
+        template_data = yaml.load(f, Loader=_YAML_LOADER)
+    
+    # Write the JSON copy for the next load; failures only cost the speedup
+    try:
+        content = _json_dumps(template_data)
+        # JSON turns YAML dates and non-string keys into strings; such templates are
+        # always parsed from YAML, so a cached load returns the same data as a fresh one
+        if _json_loads(content) != template_data:
+            logger.debug("Template %s does not round-trip through JSON; not caching it", filepath)
+            return template_data
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug("Could not write JSON cache for %s: %s", filepath, e)
+    
+    return template_data
+
+@dataclass(slots=True)
+class TemplateView:
+    """Summary of a template as returned by PromptManager.list_templates."""
+    id: str
+    name: str
+    type: str
+    description: str
+    category: str
+    
+    @classmethod
+    def from_template(cls, template_id: str, template: Dict[str, Any]) -> "TemplateView":
+        """
+        Builds the summary view of a template.
+        
+        Args:
+            template_id: ID of the template
+            template: Template dictionary
+            
+        Returns:
+            TemplateView for the template
+        """
+        return cls(
+            template_id,
+            template.get("name", template_id),
+            template.get("type", "text"),
+            template.get("description", ""),
+            template.get("metadata", {}).get("domain", "general")
+        )
+    
+    def to_dict(self) -> Dict[str, str]:
+        """
+        Converts the view to the dictionary format used by the API.
+        
+        Returns:
+            Dictionary with id, name, type, description and category
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "type": self.type,
+            "description": self.description,
+            "category": self.category
+        }
+
 class PromptManager(metaclass=Singleton):
     """
     Manager for prompt templates.
@@ -52,19 +303,46 @@ class PromptManager(metaclass=Singleton):
         # Initialize template storage
         self.templates = {}
         self.templates_dir = templates_dir
+        self._list_cache: Optional[List[Dict[str, Any]]] = None
+        self._views: Dict[str, TemplateView] = {}
         
-        # Initialize the LLM connector
-        try:
-            self.llm = ChatGPTConnector()
-            logger.info("ChatGPT connector initialized successfully")
-        except Exception as e:
-            logger.warning(f"Failed to initialize ChatGPT connector: {e}. Using fallback.")
-            self.llm = None
+        # LRU cache of LLM results keyed by a hash of the filled prompt
+        self._result_cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        
+        # The LLM connector is created on first access to self.llm
+        self._llm = None
+        self._llm_init_attempted = False
             
         # Load templates if directory is provided
         if templates_dir:
             self.load_templates(templates_dir)
             
+    @property
+    def llm(self):
+        """
+        Gets the LLM connector, initializing the ChatGPT connector on first access.
+        
+        Returns:
+            LLM connector, or None if it could not be initialized
+        """
+        if not self._llm_init_attempted:
+            self._llm_init_attempted = True
+            try:
+                from llm.chatgpt import ChatGPTConnector
+                self._llm = ChatGPTConnector()
+                logger.info("ChatGPT connector initialized successfully")
+            except Exception as e:
+                logger.warning("Failed to initialize ChatGPT connector: %s. Using fallback.", e)
+                self._llm = None
+        return self._llm
+    
+    @llm.setter
+    def llm(self, value) -> None:
+        """Sets the LLM connector, replacing the lazily created one."""
+        self._llm = value
+        self._llm_init_attempted = True
+            
     def load_templates(self, templates_dir: str) -> None:
         """
         Loads all templates from a directory.
@@ -81,29 +359,39 @@ class PromptManager(metaclass=Singleton):
         loaded_count = 0
         error_count = 0
         
-        # Load all YAML and JSON files in the directory
-        for filename in os.listdir(templates_dir):
-            filepath = os.path.join(templates_dir, filename)
-            
-            # Skip directories and non-template files
-            if os.path.isdir(filepath):
-                continue
-                
-            _, ext = os.path.splitext(filename)
-            if ext.lower() not in ['.yaml', '.yml', '.json']:
-                continue
+        # Collect all YAML and JSON files in the directory
+        template_files = []
+        with os.scandir(templates_dir) as entries:
+            for entry in entries:
+                # Skip directories and non-template files
+                if not entry.is_file():
+                    continue
                 
+                name = entry.name
+                dot = name.rfind(".")
+                ext = name[dot:].lower() if dot > 0 else ""
+                if ext in _TEMPLATE_EXTENSIONS:
+                    template_files.append((entry.path, ext))
+        
+        if not template_files:
+            logger.info("Loaded 0 templates from %s (0 errors)", templates_dir)
+            return
+        
+        # Read and parse the files concurrently; results are merged in order below
+        with ThreadPoolExecutor(max_workers=min(32, len(template_files))) as executor:
+            futures = [
+                (filepath, executor.submit(_load_template_file, filepath, ext))
+                for filepath, ext in template_files
+            ]
+        
+        for filepath, future in futures:
             try:
                 # Load file content
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    if ext.lower() in ['.yaml', '.yml']:
-                        template_data = yaml.safe_load(f)
-                    else:  # .json
-                        template_data = json.load(f)
+                template_data = future.result()
                 
                 # Check if template is valid
                 if not template_data or not isinstance(template_data, dict):
-                    logger.warning(f"Invalid template in {filepath}: not a dictionary")
+                    logger.warning("Invalid template in %s: not a dictionary", filepath)
                     error_count += 1
                     continue
                 
@@ -112,22 +400,22 @@ class PromptManager(metaclass=Singleton):
                 if not template_id:
                     # Use filename as ID
                     template_id = os.path.splitext(os.path.basename(filepath))[0]
-                    logger.info(f"Using filename as template_id: {template_id}")
+                    logger.info("Using filename as template_id: %s", template_id)
                 
                 # Ensure template has a name
                 if "name" not in template_data:
                     template_data["name"] = template_id.replace('_', ' ').title()
                 
                 # Store the template
-                self.templates[template_id] = template_data
+                self.register_template(template_id, template_data)
                 loaded_count += 1
-                logger.info(f"Loaded template: {template_id} from {filepath}")
+                logger.info("Loaded template: %s from %s", template_id, filepath)
                 
             except Exception as e:
-                logger.error(f"Error loading template from {filepath}: {e}")
+                logger.error("Error loading template from %s: %s", filepath, e)
                 error_count += 1
                 
-        logger.info(f"Loaded {loaded_count} templates from {templates_dir} ({error_count} errors)")
+        logger.info("Loaded %d templates from %s (%d errors)", loaded_count, templates_dir, error_count)
         
     def add_template(self, template: Dict[str, Any]) -> bool:
         """
@@ -150,17 +438,30 @@ class PromptManager(metaclass=Singleton):
                 
             # Check for duplicate template_id
             if template_id in self.templates:
-                logger.warning(f"Overwriting existing template: {template_id}")
+                logger.warning("Overwriting existing template: %s", template_id)
                 
             # Store the template
-            self.templates[template_id] = template
-            logger.info(f"Added template: {template_id}")
+            self.register_template(template_id, template)
+            logger.info("Added template: %s", template_id)
             return True
             
         except Exception as e:
-            logger.error(f"Error adding template: {e}")
+            logger.error("Error adding template: %s", e)
             return False
             
+    def register_template(self, template_id: str, template: Dict[str, Any]) -> None:
+        """
+        Stores a template under an ID without validating it.
+        
+        Args:
+            template_id: ID to store the template under
+            template: Template to store
+        """
+        self.templates[template_id] = template
+        self._views[template_id] = TemplateView.from_template(template_id, template)
+        self._list_cache = None
+        _precompile_template(template)
+            
     def get_template(self, template_id: str) -> Optional[Dict[str, Any]]:
         """
         Gets a template by ID.
@@ -169,13 +470,12 @@ class PromptManager(metaclass=Singleton):
             template_id: ID of the template to get
             
         Returns:
-            Template dictionary, or None if not found
+            Template dictionary, or None if not found (callers report the miss)
         """
-        template = self.templates.get(template_id)
-        if not template:
-            logger.warning(f"Template not found: {template_id}")
-            
-        return template
+        try:
+            return self.templates[template_id]
+        except KeyError:
+            return None
         
     def fill_template(self, template_id: str, parameters: Dict[str, Any]) -> str:
         """
@@ -211,9 +511,16 @@ class PromptManager(metaclass=Singleton):
                 if name not in parameters and "default" in param_schema:
                     parameters[name] = param_schema["default"]
             
-            # Fill the template using string formatting
-            filled_template = template_str.format(**parameters)
-            logger.info(f"Filled template: {template_id}")
+            # Fill the template from its pre-parsed parts
+            parts = _parse_format_string(template_str)
+            if parts is None:
+                filled_template = template_str.format(**parameters)
+            else:
+                filled_template = "".join([
+                    literal + (format(parameters[field], spec) if field is not None else "")
+                    for literal, field, spec in parts
+                ])
+            logger.info("Filled template: %s", template_id)
             return filled_template
             
         except KeyError as e:
@@ -239,19 +546,20 @@ class PromptManager(metaclass=Singleton):
             if self.templates_dir and os.path.exists(self.templates_dir):
                 self.load_templates(self.templates_dir)
         
-        # Return complete template information
-        return [
-            {
-                "id": template_id,
-                "name": template.get("name", template_id),
-                "type": template.get("type", "text"),
-                "description": template.get("description", ""),
-                "category": template.get("metadata", {}).get("domain", "general")
-            }
-            for template_id, template in self.templates.items()
-        ]
+        # Reuse the last listing unless templates were registered since; callers get their own list
+        if self._list_cache is not None:
+            return list(self._list_cache)
         
-    def generate_content(self, template_id: str, data: Dict[str, Any], temperature: float = 0.7, max_tokens: int = 500) -> str:
+        # Build complete template information from the precomputed views
+        views = self._views
+        for template_id, template in self.templates.items():
+            if template_id not in views:
+                # Registered directly in self.templates, bypassing add_template
+                views[template_id] = TemplateView.from_template(template_id, template)
+        self._list_cache = [views[template_id].to_dict() for template_id in self.templates]
+        return list(self._list_cache)
+        
+    def generate_content(self, template_id: str, data: Dict[str, Any], temperature: float = 0.7, max_tokens: int = 500, cache_enabled: Optional[bool] = None) -> str:
         """
         Generates text content using a template.
         
@@ -260,56 +568,28 @@ class PromptManager(metaclass=Singleton):
             data: Data to fill the template with
             temperature: Temperature for generation (0.0 to 1.0)
             max_tokens: Maximum number of tokens to generate
+            cache_enabled: Reuse a previous LLM result for the same prompt; by default
+                           only at temperature 0, where a sampled result would not vary
             
         Returns:
             str: Generated text content
         """
-        try:
-            # Check if template exists
-            if template_id not in self.templates:
-                error_msg = f"Template not found: {template_id}"
-                logger.error(error_msg)
-                return f"Error: {error_msg}"
-            
-            # Get the template
-            template = self.templates[template_id]
-            
-            # Check if template has 'template' field
-            if "template" not in template:
-                error_msg = f"Template {template_id} does not have a 'template' field"
-                logger.error(error_msg)
-                return f"Error: {error_msg}"
-            
-            # Fill the template with data
-            prompt = self._fill_template(template["template"], data)
-            
-            # Generate content using LLM
-            logger.info(f"Generating content with template {template_id}")
-            
-            # Check if LLM connector is available
-            if self.llm:
-                try:
-                    # Use ChatGPT connector to generate content
-                    content = self.llm.generate_text(prompt)
-                    logger.info(f"Content generated successfully using ChatGPT")
-                    return content
-                except Exception as e:
-                    logger.error(f"Error generating content with ChatGPT: {str(e)}. Using fallback.")
-            
-            # Fallback: return simulated content
-            logger.warning("Using simulated content generator (fallback)")
+        def fallback(prompt: str) -> str:
             content = f"Generated content for concept {data.get('display_name', data.get('id', 'unknown'))}\n\n"
-            content += f"This is an example of generated content using template '{template.get('name', template_id)}'.\n"
+            content += f"This is an example of generated content using template '{self._template_name(template_id)}'.\n"
             content += f"In a real system, this text would be generated by an LLM based on the prompt:\n\n{prompt}"
-            
             return content
-            
+        
+        try:
+            return self._generate_with_llm("text", template_id, data, fallback, _cache_by_default(cache_enabled, temperature), temperature, max_tokens)
+        except _TemplateUnavailable as e:
+            return f"Error: {e}"
         except Exception as e:
             error_msg = f"Error generating content: {str(e)}"
             logger.error(error_msg)
             return f"Erro: {error_msg}"
     
-    def generate_structured(self, template_id: str, data: Dict[str, Any], temperature: float = 0.7, max_tokens: int = 500) -> Dict[str, Any]:
+    def generate_structured(self, template_id: str, data: Dict[str, Any], temperature: float = 0.7, max_tokens: int = 500, cache_enabled: Optional[bool] = None) -> Dict[str, Any]:
         """
         Generates structured content using a template.
         
@@ -318,47 +598,16 @@ class PromptManager(metaclass=Singleton):
             data: Data to fill the template with
             temperature: Temperature for generation (0.0 to 1.0)
             max_tokens: Maximum number of tokens to generate
+            cache_enabled: Reuse a previous LLM result for the same prompt; by default
+                           only at temperature 0, where a sampled result would not vary
             
         Returns:
             Dict[str, Any]: Generated structured content
         """
-        try:
-            # Check if template exists
-            if template_id not in self.templates:
-                error_msg = f"Template not found: {template_id}"
-                logger.error(error_msg)
-                return {"error": error_msg}
-            
-            # Get the template
-            template = self.templates[template_id]
-            
-            # Check if template has 'template' field
-            if "template" not in template:
-                error_msg = f"Template {template_id} does not have a 'template' field"
-                logger.error(error_msg)
-                return {"error": error_msg}
-            
-            # Fill the template with data
-            prompt = self._fill_template(template["template"], data)
-            
-            # Generate structured content using LLM
-            logger.info(f"Generating structured content with template {template_id}")
-            
-            # Check if LLM connector is available
-            if self.llm:
-                try:
-                    # Use ChatGPT connector to generate structured content
-                    structured_content = self.llm.generate_structured(prompt)
-                    logger.info(f"Structured content generated successfully using ChatGPT")
-                    return structured_content
-                except Exception as e:
-                    logger.error(f"Error generating structured content with ChatGPT: {str(e)}. Using fallback.")
-            
-            # Fallback: return simulated structured content
-            logger.warning("Using simulated structured content generator (fallback)")
-            structured_content = {
+        def fallback(prompt: str) -> Dict[str, Any]:
+            return {
                 "concept": data.get("display_name", data.get("id", "unknown")),
-                "template_used": template.get("name", template_id),
+                "template_used": self._template_name(template_id),
                 "properties": {
                     "description": f"Generated description for {data.get('display_name', 'concept')}",
                     "examples": ["Example 1", "Example 2", "Example 3"],
@@ -369,68 +618,150 @@ class PromptManager(metaclass=Singleton):
                     "prompt_used": prompt
                 }
             }
-            
-            return structured_content
-            
+        
+        try:
+            return self._generate_with_llm("structured", template_id, data, fallback, _cache_by_default(cache_enabled, temperature), temperature, max_tokens)
+        except _TemplateUnavailable as e:
+            return {"error": str(e)}
         except Exception as e:
             error_msg = f"Error generating structured content: {str(e)}"
             logger.error(error_msg)
             return {"error": error_msg}
     
-    def get_embedding(self, template_id: str, data: Dict[str, Any]) -> List[float]:
+    def get_embedding(self, template_id: str, data: Dict[str, Any], cache_enabled: bool = True) -> List[float]:
         """
         Generates an embedding for the given data using a template.
         
         Args:
             template_id: ID of the template to use
             data: Data to fill the template with
+            cache_enabled: Reuse a previous LLM result for the same prompt
             
         Returns:
             List[float]: Generated embedding
         """
         try:
-            # Check if template exists
-            if template_id not in self.templates:
-                error_msg = f"Template not found: {template_id}"
-                logger.error(error_msg)
-                raise ValueError(error_msg)
-            
-            # Get the template
-            template = self.templates[template_id]
-            
-            # Check if template has 'template' field
-            if "template" not in template:
-                error_msg = f"Template {template_id} does not have a 'template' field"
-                logger.error(error_msg)
-                raise ValueError(error_msg)
-            
-            # Fill the template with data
-            prompt = self._fill_template(template["template"], data)
+            return self._generate_with_llm("embedding", template_id, data, lambda prompt: _fallback_embedding(), cache_enabled)
+        except Exception as e:
+            error_msg = f"Error generating embedding: {str(e)}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+    
+    def _generate_with_llm(self, kind: str, template_id: str, data: Dict[str, Any], fallback: Callable[[str], Any], cache_enabled: bool, *options: Any) -> Any:
+        """
+        Fills a template and sends it to the LLM, falling back to simulated output.
+        
+        Args:
+            kind: Kind of result ("text", "structured" or "embedding")
+            template_id: ID of the template to use
+            data: Data to fill the template with
+            fallback: Builds the simulated result from the filled prompt
+            cache_enabled: Reuse a previous LLM result for the same prompt
+            *options: Generation options that affect the result
             
-            # Generate embedding using LLM
-            logger.info(f"Generating embedding with template {template_id}")
+        Returns:
+            LLM result, or the fallback result if no LLM is available or it fails
             
-            # Check if LLM connector is available
-            if self.llm:
-                try:
-                    # Use ChatGPT connector to generate the embedding
-                    embedding = self.llm.generate_embeddings(prompt)
-                    logger.info(f"Embedding generated successfully using ChatGPT")
-                    return embedding
-                except Exception as e:
-                    logger.error(f"Error generating embedding with ChatGPT: {str(e)}. Using fallback.")
+        Raises:
+            _TemplateUnavailable: If the template is missing or has no 'template' field
+        """
+        llm_method, label = _LLM_CALLS[kind]
+        
+        template = self.get_template(template_id)
+        if template is None:
+            error_msg = f"Template not found: {template_id}"
+            logger.error(error_msg)
+            raise _TemplateUnavailable(error_msg)
+        if "template" not in template:
+            error_msg = f"Template {template_id} does not have a 'template' field"
+            logger.error(error_msg)
+            raise _TemplateUnavailable(error_msg)
+        
+        # Fill the template with data
+        prompt = self._fill_template(template["template"], data)
+        logger.info("Generating %s with template %s", label, template_id)
+        
+        # Check if LLM connector is available
+        if self.llm:
+            to_cache, from_cache = _CACHE_CODECS[kind]
+            cache_key = self._result_cache_key(kind, prompt, *options)
+            if cache_enabled:
+                cached = self._cache_get(cache_key)
+                if cached is not None:
+                    return from_cache(cached)
+            try:
+                # Use ChatGPT connector to generate the result
+                result = getattr(self.llm, llm_method)(prompt)
+                logger.info("%s generated successfully using ChatGPT", label.capitalize())
+                if cache_enabled:
+                    self._cache_put(cache_key, to_cache(result))
+                return result
+            except Exception as e:
+                logger.error("Error generating %s with ChatGPT: %s. Using fallback.", label, e)
+        
+        logger.warning("Using simulated %s generator (fallback)", label)
+        return fallback(prompt)
+    
+    def _template_name(self, template_id: str) -> str:
+        """
+        Gets the display name of a template.
+        
+        Args:
+            template_id: ID of the template
             
-            # Fallback: return simulated embedding
-            logger.warning("Using simulated embedding generator (fallback)")
-            import random
-            embedding = [random.uniform(-1.0, 1.0) for _ in range(32)]
+        Returns:
+            Template name
+        """
+        view = self._views.get(template_id)
+        if view is None:
+            view = self._views[template_id] = TemplateView.from_template(template_id, self.templates[template_id])
+        return view.name
+    
+    @staticmethod
+    def _result_cache_key(kind: str, prompt: str, *options: Any) -> str:
+        """
+        Builds the result cache key for an LLM call.
+        
+        Args:
+            kind: Kind of result ("text", "structured" or "embedding")
+            prompt: Filled prompt sent to the LLM
+            *options: Generation options that affect the result
             
-            return embedding
+        Returns:
+            Hex digest identifying the call
+        """
+        raw = "|".join([kind, prompt, *map(str, options)])
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def _cache_get(self, key: str) -> Any:
+        """
+        Gets a cached LLM result, marking it as recently used.
+        
+        Args:
+            key: Result cache key
             
-        except Exception as e:
-            error_msg = f"Error generating embedding: {str(e)}"
-            logger.error(error_msg)
-            raise ValueError(error_msg)
+        Returns:
+            Cached result, or None if not cached
+        """
+        with self._result_cache_lock:
+            result = self._result_cache.get(key)
+            if result is not None:
+                self._result_cache.move_to_end(key)
+            return result
+    
+    def _cache_put(self, key: str, result: Any) -> None:
+        """
+        Stores an LLM result, evicting the least recently used entry when full.
+        
+        Args:
+            key: Result cache key
+            result: Result to store
+        """
+        with self._result_cache_lock:
+            self._result_cache[key] = result
+            self._result_cache.move_to_end(key)
+            if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
     
     def _fill_template(self, template_text: str, data: Dict[str, Any]) -> str:
         """
@@ -444,13 +775,11 @@ class PromptManager(metaclass=Singleton):
             str: Filled template
         """
         try:
-            # Create a copy of the data to avoid modifying the original
-            context = data.copy() if data else {}
+            # Jinja2 copies the context into its own namespace, so data is never modified
+            context = data or {}
             
-            # Process the template using Jinja2
-            from jinja2 import Template
-            jinja_template = Template(template_text)
-            filled_template = jinja_template.render(**context)
+            # Process the template using the cached compiled Jinja2 template
+            filled_template = _compile_template(template_text).render(context)
             
             return filled_template
             
@@ -1,18 +1,76 @@
-from typing import Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
 from llm.interface import LLMInterface
 from prompt.template_manager import TemplateManager
 
+# Campos obrigatórios de uma sugestão de template
+_REQUIRED_FIELDS = frozenset({"name", "type", "content", "variables", "description"})
+
 class SuggestionManager:
     """Gerenciador de sugestões de templates."""
     
-    def __init__(self, llm: LLMInterface):
+    # Prompts enviados ao LLM; chaves JSON literais escapadas como {{ }} para str.format
+    TEMPLATE_PROMPT = """
+        Por favor, sugira um template do tipo {template_type} para o conceito: {name}.
+        
+        O template deve incluir:
+        - Variáveis relevantes para o conceito
+        - Estrutura adequada para o tipo de conteúdo
+        - Descrição clara do propósito
+        - Exemplo de uso
+        
+        Responda no formato JSON:
+        {{
+            "name": "Nome do Template",
+            "type": "{template_type}",
+            "content": "Conteúdo do template",
+            "variables": ["lista", "de", "variáveis"],
+            "description": "Descrição do template",
+            "example": "Exemplo de uso"
+        }}
+        """
+    
+    CATEGORY_PROMPT = """
+        Por favor, sugira uma categoria de template adequada para o conceito: {name}.
+        
+        Considere as seguintes categorias:
+        - Explicação
+        - Descrição
+        - Sumário
+        - Exemplo
+        - Estruturado
+        - Embedding
+        
+        Responda no formato JSON:
+        {{
+            "category": "Nome da Categoria",
+            "reason": "Justificativa para a escolha"
+        }}
+        """
+    
+    VARIABLES_PROMPT = """
+        Por favor, sugira variáveis relevantes para um template do tipo {template_type} sobre o conceito: {name}.
+        
+        Considere as seguintes características do conceito:
+        - Tipo: {type}
+        - Descrição: {description}
+        - Propriedades: {properties}
+        
+        Liste as variáveis no formato:
+        - variavel1
+        - variavel2
+        - variavel3
+        """
+    
+    def __init__(self, llm: LLMInterface, template_manager: Optional[TemplateManager] = None):
         """Inicializa o gerenciador de sugestões.
         
         Args:
             llm: Interface do LLM para geração
+            template_manager: Gerenciador de templates a reutilizar (padrão: instância compartilhada do llm)
         """
         self.llm = llm
-        self.template_manager = TemplateManager(llm)
+        self.template_manager = template_manager or TemplateManager.instance(llm)
     
     def suggest_template(self, concept: Dict[str, Any], template_type: str) -> Dict[str, Any]:
         """Sugere um template baseado em um conceito.
@@ -25,25 +83,7 @@ class SuggestionManager:
             Sugestão de template
         """
         # Preparar prompt para sugestão
-        prompt = f"""
-        Por favor, sugira um template do tipo {template_type} para o conceito: {concept['name']}.
-        
-        O template deve incluir:
-        - Variáveis relevantes para o conceito
-        - Estrutura adequada para o tipo de conteúdo
-        - Descrição clara do propósito
-        - Exemplo de uso
-        
-        Responda no formato JSON:
-        {{
-            "name": "Nome do Template",
-            "type": "{template_type}",
-            "content": "Conteúdo do template",
-            "variables": ["lista", "de", "variáveis"],
-            "description": "Descrição do template",
-            "example": "Exemplo de uso"
-        }}
-        """
+        prompt = self.TEMPLATE_PROMPT.format(template_type=template_type, name=concept['name'])
         
         # Gerar sugestão usando LLM
         suggestion = self.llm.generate_structured(prompt)
@@ -61,23 +101,7 @@ class SuggestionManager:
             Sugestão de categoria
         """
         # Preparar prompt para sugestão de categoria
-        prompt = f"""
-        Por favor, sugira uma categoria de template adequada para o conceito: {concept['name']}.
-        
-        Considere as seguintes categorias:
-        - Explicação
-        - Descrição
-        - Sumário
-        - Exemplo
-        - Estruturado
-        - Embedding
-        
-        Responda no formato JSON:
-        {{
-            "category": "Nome da Categoria",
-            "reason": "Justificativa para a escolha"
-        }}
-        """
+        prompt = self.CATEGORY_PROMPT.format(name=concept['name'])
         
         # Gerar sugestão usando LLM
         suggestion = self.llm.generate_structured(prompt)
@@ -95,19 +119,13 @@ class SuggestionManager:
             Lista de variáveis sugeridas
         """
         # Preparar prompt para sugestão de variáveis
-        prompt = f"""
-        Por favor, sugira variáveis relevantes para um template do tipo {template_type} sobre o conceito: {concept['name']}.
-        
-        Considere as seguintes características do conceito:
-        - Tipo: {concept.get('type', '')}
-        - Descrição: {concept.get('description', '')}
-        - Propriedades: {concept.get('properties', {})}
-        
-        Liste as variáveis no formato:
-        - variavel1
-        - variavel2
-        - variavel3
-        """
+        prompt = self.VARIABLES_PROMPT.format(
+            template_type=template_type,
+            name=concept['name'],
+            type=concept.get('type', ''),
+            description=concept.get('description', ''),
+            properties=concept.get('properties', {})
+        )
         
         # Gerar sugestão usando LLM
         suggestion = self.llm.generate_text(prompt)
@@ -115,6 +133,29 @@ class SuggestionManager:
         # Extrair variáveis da sugestão
         return [v.strip() for v in suggestion.split("\n") if v.strip()]
     
+    def suggest_all(self, concept: Dict[str, Any], template_type: str) -> Dict[str, Any]:
+        """Sugere template, categoria e variáveis para um conceito de uma só vez.
+        
+        As três consultas ao LLM são feitas em paralelo.
+        
+        Args:
+            concept: Dicionário com informações do conceito
+            template_type: Tipo de template desejado
+            
+        Returns:
+            Dicionário com as chaves "template", "category" e "variables"
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            template = executor.submit(self.suggest_template, concept, template_type)
+            category = executor.submit(self.suggest_category, concept)
+            variables = executor.submit(self.suggest_variables, concept, template_type)
+            
+            return {
+                "template": template.result(),
+                "category": category.result(),
+                "variables": variables.result()
+            }
+    
     def _format_suggestion(self, suggestion: Dict[str, Any]) -> Dict[str, Any]:
         """Formata uma sugestão de template.
         
@@ -125,10 +166,8 @@ class SuggestionManager:
             Template formatado
         """
         # Garantir que todos os campos obrigatórios existam
-        required_fields = ["name", "type", "content", "variables", "description"]
-        for field in required_fields:
-            if field not in suggestion:
-                suggestion[field] = ""
+        for field in _REQUIRED_FIELDS.difference(suggestion):
+            suggestion[field] = ""
         
         # Formatar variáveis como lista
         if isinstance(suggestion["variables"], str):
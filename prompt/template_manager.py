@@ -1,85 +1,305 @@
-from typing import Dict, Any, List
 import os
 import yaml
 import json
+import hashlib
 import logging
+import re
+import sys
+import bisect
+import copy
+import functools
+import math
+import threading
+import weakref
+import numpy as np
 import streamlit as st
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from jinja2 import DebugUndefined, Environment, Template, TemplateSyntaxError
+except ImportError:
+    Environment = None
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from llm.interface import LLMInterface
+from prompt.common import PLACEHOLDER_RE, concept_parameters
 from prompt.llm_integration import LLMPromptManager
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YAML_LOADER
+except ImportError:
+    from yaml import SafeLoader as _YAML_LOADER
+
+# JSON codec for LLM output and the cache files (orjson when installed)
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+    
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+# Parsed templates are cached as one JSON file under the templates directory;
+# bump the version whenever the shape of the loaded template dicts changes
+TEMPLATE_CACHE_FILE = os.path.join(".cache", "templates.cache.json")
+TEMPLATE_CACHE_VERSION = 4
+
+# LLM intent analysis results, keyed by a hash of the template ID and content
+INTENT_CACHE_FILE = os.path.join(".cache", "intent_cache.json")
+
+# Maximum number of concurrent LLM calls for template intent analysis
+LLM_PARALLELISM = max(1, int(os.getenv("ONTOMED_LLM_PARALLELISM", "4")))
+
+# Stand-in intent_info for templates loaded without one (shared, never mutated)
+_PENDING_INTENT: Dict[str, Any] = {"intent": "unknown"}
+
+# Parse template YAML files in worker processes (opt-in, some Streamlit deployments don't allow it)
+PARALLEL_YAML = os.getenv("ONTOMED_PARALLEL_YAML") == "1"
+
+# Minimum number of template files before worker processes are worth starting
+PARALLEL_YAML_MIN_FILES = 8
+
+# Static part of the intent analysis prompt; the template details are appended after it.
+# Keep it byte-identical across calls: LLM providers cache prompt prefixes, and any edit
+# here invalidates that cache (and the intent analyses cached on disk stay as they are)
+INTENT_PROMPT_PREFIX = """Analise o template de resposta no final desta mensagem e extraia:
+1. A intenção principal que este template atende (use snake_case em inglês, ex: explain_term, list_terms, create_literature_summary)
+2. Palavras-chave relevantes para identificar esta intenção em PORTUGUÊS (5-10 palavras)
+3. Palavras-chave relevantes para identificar esta intenção em INGLÊS (5-10 palavras)
+4. Padrões de frases em PORTUGUÊS que um usuário poderia usar para ativar esta intenção (3-5 padrões)
+5. Padrões de frases em INGLÊS que um usuário poderia usar para ativar esta intenção (3-5 padrões)
+6. Tipos de entidades que são esperadas para este template (ex: termo_medico, medicamento)
+
+Responda em formato JSON com os seguintes campos:
+{
+    "intent": "intenção_principal",
+    "keywords_language": ["pt", "en"],
+    "keywords_pt": ["palavra1", "palavra2", "..."],
+    "keywords_en": ["word1", "word2", "..."],
+    "patterns_pt": ["padrão 1", "padrão 2", "..."],
+    "patterns_en": ["pattern 1", "pattern 2", "..."],
+    "entities": ["entidade1", "entidade2", "..."]
+}
+"""
+
+# Temperature bands for the instruction prepended by generate_content:
+# below 0.3 concise, above 0.7 creative, none in between (both bounds included)
+_TEMPERATURE_BOUNDS = (0.3, math.nextafter(0.7, math.inf))
+_TEMPERATURE_PREFIXES = (
+    "Instrução: Seja conciso e direto em suas respostas.\n\n",
+    "",
+    "Instrução: Seja criativo e variável em suas respostas.\n\n",
+)
+
+# Maximum number of filled templates kept by TemplateManager.fill_template
+FILL_CACHE_SIZE = 256
+
+# Maximum number of embeddings kept by TemplateManager.get_embedding
+EMBEDDING_CACHE_SIZE = 1024
+
+# Structural reference from one template's content to another, e.g. {{template:care_plan}}
+TEMPLATE_REFERENCE_RE = re.compile(r"\{\{\s*template:([\w-]+)\s*\}\}")
+
+# Template fields with a few distinct values shared by many templates, interned at load
+_INTERNED_FIELDS = ("id", "type", "status", "category")
+
+# Renders template content; placeholders without a value are kept in the output
+_JINJA_ENV = Environment(
+    autoescape=False, undefined=DebugUndefined, keep_trailing_newline=True
+) if Environment is not None else None
+
+@functools.lru_cache(maxsize=256)
+def _compile_content(content: str) -> Optional["Template"]:
+    """Compiles template content with Jinja2, memoized by the content text.
+    
+    Args:
+        content: Template content with {{var}} placeholders
+        
+    Returns:
+        Compiled template, or None if Jinja2 is unavailable or cannot parse the content
+    """
+    if _JINJA_ENV is None:
+        return None
+    try:
+        return _JINJA_ENV.from_string(content)
+    except TemplateSyntaxError as e:
+        logger.debug("Template content is not valid Jinja2, using plain substitution: %s", e)
+        return None
+
+@st.cache_resource(show_spinner=False)
+def _build_templates(templates_dir: str, skip_intent_analysis: bool, llm_id: str,
+                     _manager: "TemplateManager") -> Tuple[Dict[str, Any], ...]:
+    """Loads (and analyzes) the templates once per process.
+    
+    Streamlit keys the cache on templates_dir, skip_intent_analysis and llm_id;
+    _manager is not hashed and only provides the loading and analysis methods.
+    
+    Returns:
+        Tuple of templates shared by every session on this server
+    """
+    logger.info("Loading templates from disk. skip_intent_analysis=%s", skip_intent_analysis)
+    templates = _manager._load_templates_from_disk()
+    if skip_intent_analysis:
+        logger.info("Skipping template intent analysis (skip_intent_analysis=True)")
+    else:
+        logger.info("Analyzing templates with LLM for intent extraction")
+        templates = _manager._analyze_templates(templates)
+    
+    # The source path is only needed while loading and analyzing
+    for template in templates:
+        template.pop("_source_path", None)
+        # Cached and freshly parsed templates alike share one string object per distinct value
+        for field in _INTERNED_FIELDS:
+            value = template.get(field)
+            if isinstance(value, str):
+                template[field] = sys.intern(value)
+        # Compile once here so generate_content only renders; content without
+        # placeholders is static, is never rendered and needs no compiled template
+        content = template.get("content") or ""
+        if "{" in content:
+            _compile_content(content)
+    # Immutable so no session can add or drop templates in the shared result
+    return tuple(templates)
+
+def _stringify(value: Any) -> str:
+    """Serializes a template parameter value once, before rendering.
+    
+    Dicts and lists become JSON with sorted keys, so the same concept always
+    produces the same prompt text; other values use str().
+    """
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+    return str(value)
+
+def _render_content(content: str, variables: Dict[str, Any]) -> str:
+    """Fills the {{var}} placeholders of template content.
+    
+    Placeholders without a value are kept as they are.
+    
+    Args:
+        content: Template content
+        variables: Values for the placeholders
+        
+    Returns:
+        Filled content
+    """
+    compiled = _compile_content(content)
+    if compiled is not None:
+        return compiled.render(variables)
+    return PLACEHOLDER_RE.sub(
+        lambda m: str(variables[m.group(1)]) if m.group(1) in variables else m.group(0),
+        content
+    )
+
+def _parse_yaml_file(path: str) -> Any:
+    """Parses a YAML file; module-level so worker processes can run it.
+    
+    Args:
+        path: Path to the YAML file
+        
+    Returns:
+        Parsed YAML data
+    """
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+def _read_file(path: str) -> bytes:
+    """Reads a whole file.
+    
+    Args:
+        path: Path to the file
+        
+    Returns:
+        File content
+    """
+    with open(path, 'rb') as f:
+        return f.read()
+
+def _parse_yaml_read(read: "Future[bytes]") -> Any:
+    """Parses YAML content once its read has completed.
+    
+    Args:
+        read: Pending read of the YAML file, see _read_file()
+        
+    Returns:
+        Parsed YAML data
+    """
+    return yaml.load(read.result(), Loader=_YAML_LOADER)
+
 class TemplateManager:
     """Template manager for content generation."""
     
-    def __init__(self, llm: LLMInterface, skip_intent_analysis: bool = False):
+    # Shared instances keyed by id(llm), see instance()
+    _instances: "weakref.WeakValueDictionary[int, TemplateManager]" = weakref.WeakValueDictionary()
+    
+    # Resolved once per process, see _get_templates_dir()
+    _templates_dir: Optional[str] = None
+    
+    # Parsed YAML data by file path, with the file's mtime when it was parsed
+    _yaml_cache: Dict[str, Tuple[int, Any]] = {}
+    
+    @classmethod
+    def instance(cls, llm: LLMInterface, skip_intent_analysis: bool = False) -> "TemplateManager":
+        """Gets the shared template manager for an LLM, creating it on first use.
+        
+        Args:
+            llm: LLM interface for generation
+            skip_intent_analysis: Passed to the constructor when the manager is created here
+            
+        Returns:
+            Template manager shared by every caller using the same LLM
+        """
+        manager = cls._instances.get(id(llm))
+        if manager is None or manager.llm is not llm:
+            manager = cls(llm, skip_intent_analysis=skip_intent_analysis)
+            cls._instances[id(llm)] = manager
+        return manager
+    
+    def __init__(self, llm: LLMInterface, skip_intent_analysis: bool = False, persist_intent_analysis: bool = False):
         """Initializes the template manager.
         
         Args:
             llm: LLM interface for generation
             skip_intent_analysis: Se True, pula a análise de intenção dos templates
                                   Útil quando os templates já foram inicializados anteriormente
+            persist_intent_analysis: Whether to write LLM intent analysis results back
+                                     into the template YAML files (they are version-controlled
+                                     sources, so only for deliberate updates; the intent cache
+                                     already avoids repeating the analysis)
         """
         self.llm = llm
         self.prompt_manager = LLMPromptManager(llm)
         self.skip_intent_analysis = skip_intent_analysis
-        
-        # Verify if templates were initialized in Home.py
-        templates_initialized = 'templates_initialized' in st.session_state and st.session_state.templates_initialized
-        
-        # Initialize in session state if not exists
-        if 'tm_templates' not in st.session_state:
-            st.session_state.tm_templates = []
-            
-        if 'tm_templates_loaded' not in st.session_state:
-            st.session_state.tm_templates_loaded = False
-        
-        # Ensure consistency between flags
-        if templates_initialized and not st.session_state.tm_templates_loaded:
-            st.session_state.tm_templates_loaded = True
-            logger.info("Marking tm_templates_loaded as True since templates_initialized is True")
-        
+        self.persist_intent_analysis = persist_intent_analysis
         self.templates_dir = self._get_templates_dir()
         
-        # Verify if we need to load the templates
-        templates_need_loading = not st.session_state.tm_templates_loaded or len(st.session_state.tm_templates) == 0
+        # Embeddings by hash of the embedded text, see get_embedding()
+        self._embedding_cache: "OrderedDict[str, tuple]" = OrderedDict()
         
-        # If we already have templates in the session_state, use the cached templates
-        if 'tm_templates' in st.session_state and len(st.session_state.tm_templates) > 0:
-            logger.info(f"Templates already exist in session_state ({len(st.session_state.tm_templates)} templates). Using cache.")
-            self._templates = st.session_state.tm_templates
-            
-            # Ensure that the flag is set correctly
-            if not st.session_state.tm_templates_loaded:
-                st.session_state.tm_templates_loaded = True
-                logger.info("Updating tm_templates_loaded flag to True")
-            return
+        # Loaded on the first intent analysis, see _get_intent_cache()
+        self._intent_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._intent_cache_dirty = False
+        self._intent_cache_lock = threading.Lock()
         
-        if templates_need_loading:
-            logger.info(f"Loading templates from disk. skip_intent_analysis={self.skip_intent_analysis}")
-            # First, load templates from disk (without analysis)
-            raw_templates = self._load_templates_from_disk()
-            
-            # Then, analyze templates if necessary
-            if not self.skip_intent_analysis:
-                logger.info("Analyzing templates with LLM for intent extraction")
-                self._analyze_templates(raw_templates)
-            else:
-                logger.info("Skipping template intent analysis (skip_intent_analysis=True)")
-                # Only add templates without analysis
-                self.templates = raw_templates
-                # Store in session_state
-                st.session_state.tm_templates = raw_templates
-                
-            st.session_state.tm_templates_loaded = True
-            # Also mark templates_initialized as True to maintain consistency
-            st.session_state.templates_initialized = True
-            logger.info(f"Templates loaded and cached in session state")
+        # Keep this session's templates, including templates created or deleted in it
+        if st.session_state.get("tm_templates"):
+            self.templates = st.session_state.tm_templates
         else:
-            logger.info(f"Using cached templates from session state. skip_intent_analysis={self.skip_intent_analysis}")
-            # Use templates from session_state
-            self._templates = st.session_state.tm_templates
+            llm_id = getattr(llm, "model_name", type(llm).__name__)
+            # The loaded list is shared across sessions; copy it so additions and deletions stay per session
+            self.templates = list(_build_templates(self.templates_dir, skip_intent_analysis, llm_id, self))
+        
+        # Home.py skips its own template initialization once this is set
+        st.session_state.templates_initialized = True
     
     @property
     def templates(self):
@@ -92,9 +312,31 @@ class TemplateManager:
     def templates(self, value):
         """Sets the templates."""
         self._templates = value
+        self._reverse_deps = None
+        self._build_indexes()
+        # Filled templates may be stale after any change to the templates
+        self._fill_cache: "OrderedDict[tuple, str]" = OrderedDict()
         # Update templates in session_state
         st.session_state.tm_templates = value
     
+    def _build_indexes(self) -> None:
+        """Builds the ID, name and intent lookup indexes for the current templates.
+        
+        The first template wins when several share a key, as with the previous linear scans.
+        """
+        by_id: Dict[str, Dict[str, Any]] = {}
+        by_name: Dict[str, Dict[str, Any]] = {}
+        by_intent: Dict[str, Dict[str, Any]] = {}
+        for template in self.templates:
+            by_id.setdefault(template["id"], template)
+            by_name.setdefault(template["name"], template)
+            by_intent.setdefault(template.get("intent_info", {}).get("intent"), template)
+        self._by_id = by_id
+        self._by_name = by_name
+        self._by_intent = by_intent
+        self._template_ids = tuple(template["id"] for template in self.templates)
+        self._template_names = tuple(template["name"] for template in self.templates)
+    
     def get_template(self, template_id: str) -> Optional[Dict[str, Any]]:
         """Gets a template by ID.
         
@@ -104,12 +346,133 @@ class TemplateManager:
         Returns:
             Template or None if not found
         """
+        return self._by_id.get(template_id)
+    
+    def exists(self, template_id: str) -> bool:
+        """Checks whether a template exists.
+        
+        Args:
+            template_id: ID of the template to check
+            
+        Returns:
+            True if the template exists, False otherwise
+        """
+        return self.get_template(template_id) is not None
+    
+    def create_template(self, template_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Creates a new template.
+        
+        Args:
+            template_data: Template data
+            
+        Returns:
+            Created template
+            
+        Raises:
+            ValueError: If a required field is missing or a template with the ID already exists
+        """
+        required_fields = ["name", "type", "content", "variables"]
+        for field in required_fields:
+            if field not in template_data:
+                raise ValueError(f"Required field '{field}' not found")
+        
+        template_id = template_data.get("id")
+        if template_id and self.exists(template_id):
+            raise ValueError(f"Template already exists: {template_id}")
+        if not template_id:
+            # Generated IDs skip ones still taken after earlier deletions
+            number = len(self.templates) + 1
+            while self.exists(f"temp_{number}"):
+                number += 1
+            template_id = f"temp_{number}"
+        
+        template = {
+            "id": template_id,
+            **{k: v for k, v in template_data.items() if k != "id"}
+        }
+        self.templates = self.templates + [template]
+        
+        return template
+    
+    def add_template(self, template_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Adds a template as given; unlike create_template, variables are optional.
+        
+        Args:
+            template_data: Template data
+            
+        Returns:
+            Added template
+        """
+        required_fields = ["name", "type", "content"]
+        for field in required_fields:
+            if field not in template_data:
+                raise ValueError(f"Required field '{field}' not found")
+        
+        if "id" not in template_data:
+            template_data["id"] = f"temp_{len(self.templates) + 1}"
+        self.templates = self.templates + [template_data]
+        
+        return template_data
+    
+    def update_template(self, template_id: str, updated_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Updates an existing template.
+        
+        Args:
+            template_id: Template ID
+            updated_data: Updated template data
+            
+        Returns:
+            Updated template
+        """
+        template = self.get_template(template_id)
+        if not template:
+            raise ValueError(f"Template not found: {template_id}")
+        
+        # Replace rather than mutate: the loaded template dicts are shared by all sessions
+        updated = {**template, **{k: v for k, v in updated_data.items() if k != "id"}}
+        self.templates = [updated if t is template else t for t in self.templates]
+        
+        return updated
+    
+    def delete_template(self, template_id: str) -> None:
+        """Deletes a template.
+        
+        Args:
+            template_id: Template ID
+        """
+        self.templates = [t for t in self.templates if t["id"] != template_id]
+    
+    def build_dependency_index(self) -> Dict[str, set]:
+        """Builds the reverse dependency index from template references.
+        
+        A template depends on another when its content contains a
+        ``{{template:<id>}}`` reference to it.
+        
+        Returns:
+            Dict mapping each referenced template ID to the IDs of the templates referencing it
+        """
+        reverse_deps: Dict[str, set] = {}
         for template in self.templates:
-            if template["id"] == template_id:
-                return template
-        return None
+            for ref_id in TEMPLATE_REFERENCE_RE.findall(template.get("content") or ""):
+                reverse_deps.setdefault(ref_id, set()).add(template["id"])
+        self._reverse_deps = reverse_deps
+        return reverse_deps
     
-    def get_embedding(self, template_id: str, concept: Dict[str, Any]) -> List[float]:
+    def get_dependents(self, template_id: str) -> List[str]:
+        """Gets the IDs of the templates that reference a template.
+        
+        Args:
+            template_id: ID of the referenced template
+            
+        Returns:
+            Sorted list of dependent template IDs
+        """
+        reverse_deps = getattr(self, "_reverse_deps", None)
+        if reverse_deps is None:
+            reverse_deps = self.build_dependency_index()
+        return sorted(reverse_deps.get(template_id, ()))
+    
+    def get_embedding(self, template_id: str, concept: Dict[str, Any]) -> Optional[List[float]]:
         """Generates an embedding for a concept using a template.
         
         Args:
@@ -117,7 +480,7 @@ class TemplateManager:
             concept: Dictionary with concept information
             
         Returns:
-            List of floats representing the embedding
+            List of floats representing the embedding, or None if the LLM returned no embedding
         """
         try:
             # Get the template
@@ -128,13 +491,111 @@ class TemplateManager:
             # Generate text using the template and concept
             generated_text = self.fill_template(template_id, concept)
             
+            # The embedding only depends on the text, so repeated concepts skip the LLM call
+            cached = self._get_cached_embedding(generated_text)
+            if cached is not None:
+                return cached
+            
             # Generate embedding using the LLM
-            return self.llm.generate_embeddings(generated_text)
+            embedding = self.llm.generate_embeddings(generated_text)
+            self._cache_embedding(generated_text, embedding)
+            return embedding or None
+            
+        except Exception as e:
+            logger.error("Error generating embedding: %s", e)
+            raise
+    
+    def get_embeddings_batch(self, template_id: str, concepts: List[Dict[str, Any]]) -> List[Optional[List[float]]]:
+        """Generates embeddings for several concepts using a template.
+        
+        Concepts whose text was already embedded come from the cache; the rest
+        are sent to the LLM in a single batch.
+        
+        Args:
+            template_id: ID of the template to use
+            concepts: Dictionaries with concept information
+            
+        Returns:
+            List of embeddings, in the same order as the concepts; None where the
+            LLM returned no embedding
+        """
+        try:
+            template = self.get_template(template_id)
+            if not template:
+                raise ValueError(f"Template not found: {template_id}")
+            
+            texts = [self.fill_template(template_id, concept) for concept in concepts]
+            embeddings: List[Optional[List[float]]] = [self._get_cached_embedding(text) for text in texts]
+            
+            # Each distinct uncached text is embedded once
+            missing = list(dict.fromkeys(text for text, embedding in zip(texts, embeddings) if embedding is None))
+            if missing:
+                generated = dict(zip(missing, self.llm.generate_embeddings_batch(missing)))
+                for text, embedding in generated.items():
+                    self._cache_embedding(text, embedding)
+                embeddings = [
+                    embedding if embedding is not None else (list(generated[text]) or None)
+                    for text, embedding in zip(texts, embeddings)
+                ]
+            return embeddings
             
         except Exception as e:
-            logger.error(f"Error generating embedding: {str(e)}")
+            logger.error("Error generating embeddings: %s", e)
             raise
     
+    def get_embeddings_array(self, template_id: str, concepts: List[Dict[str, Any]]) -> np.ndarray:
+        """Generates embeddings for several concepts as one float32 matrix.
+        
+        Args:
+            template_id: ID of the template to use
+            concepts: Dictionaries with concept information
+            
+        Returns:
+            Array of shape (len(concepts), dimension), one row per concept; rows of
+            concepts without an embedding are NaN
+        """
+        embeddings = self.get_embeddings_batch(template_id, concepts)
+        dimension = next((len(embedding) for embedding in embeddings if embedding is not None), 0)
+        
+        # Fill the rows of one preallocated buffer instead of stacking per-concept arrays
+        out = np.empty((len(embeddings), dimension), dtype=np.float32)
+        for i, embedding in enumerate(embeddings):
+            if embedding is None:
+                out[i] = np.nan
+            else:
+                out[i] = embedding
+        return out
+    
+    def _get_cached_embedding(self, text: str) -> Optional[List[float]]:
+        """Gets the cached embedding of a text.
+        
+        Args:
+            text: Embedded text
+            
+        Returns:
+            Copy of the cached embedding, or None if not cached
+        """
+        cache_key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        cached = self._embedding_cache.get(cache_key)
+        if cached is None:
+            return None
+        self._embedding_cache.move_to_end(cache_key)
+        return list(cached)
+    
+    def _cache_embedding(self, text: str, embedding: List[float]) -> None:
+        """Caches the embedding of a text; empty (failed) embeddings are not cached.
+        
+        Args:
+            text: Embedded text
+            embedding: Embedding of the text
+        """
+        if not embedding:
+            return
+        cache_key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        self._embedding_cache[cache_key] = tuple(embedding)
+        if len(self._embedding_cache) > EMBEDDING_CACHE_SIZE:
+            self._embedding_cache.popitem(last=False)
+    
     def get_templates(self) -> List[Dict[str, Any]]:
         """Gets all templates.
         
@@ -143,21 +604,21 @@ class TemplateManager:
         """
         return self.templates
     
-    def get_template_ids(self) -> List[str]:
+    def get_template_ids(self) -> Tuple[str, ...]:
         """Gets all template IDs.
         
         Returns:
-            List of template IDs
+            Tuple of template IDs
         """
-        return [template["id"] for template in self.templates]
+        return self._template_ids
     
-    def get_template_names(self) -> List[str]:
+    def get_template_names(self) -> Tuple[str, ...]:
         """Gets all template names.
         
         Returns:
-            List of template names
+            Tuple of template names
         """
-        return [template["name"] for template in self.templates]
+        return self._template_names
     
     def get_template_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """Gets a template by name.
@@ -168,10 +629,7 @@ class TemplateManager:
         Returns:
             Template or None if not found
         """
-        for template in self.templates:
-            if template["name"] == name:
-                return template
-        return None
+        return self._by_name.get(name)
     
     def get_template_by_intent(self, intent: str) -> Optional[Dict[str, Any]]:
         """Gets a template by intent.
@@ -182,10 +640,7 @@ class TemplateManager:
         Returns:
             Template or None if not found
         """
-        for template in self.templates:
-            if template.get("intent_info", {}).get("intent") == intent:
-                return template
-        return None
+        return self._by_intent.get(intent)
     
     def fill_template(self, template_id: str, variables: Dict[str, Any]) -> str:
         """Fills a template with variables.
@@ -197,12 +652,27 @@ class TemplateManager:
         Returns:
             Filled template
         """
+        # Reruns often fill the same template with the same variables
+        try:
+            cache_key = (template_id, json.dumps(variables, sort_keys=True, default=str))
+        except (TypeError, ValueError):
+            cache_key = None
+        if cache_key is not None and cache_key in self._fill_cache:
+            self._fill_cache.move_to_end(cache_key)
+            return self._fill_cache[cache_key]
+        
         template = self.get_template(template_id)
         if not template:
             raise ValueError(f"Template not found: {template_id}")
             
         # Fill template with variables
-        return self.prompt_manager.fill_template(template["content"], variables)
+        filled = _render_content(template["content"], variables)
+        
+        if cache_key is not None:
+            self._fill_cache[cache_key] = filled
+            if len(self._fill_cache) > FILL_CACHE_SIZE:
+                self._fill_cache.popitem(last=False)
+        return filled
     
     def fill_structured_template(self, template_id: str, variables: Dict[str, Any]) -> Dict[str, Any]:
         """Fills a structured template with variables.
@@ -220,34 +690,35 @@ class TemplateManager:
                 raise ValueError(f"Template not found: {template_id}")
                 
             # Fill template with variables
-            filled_template = self.prompt_manager.fill_template(template["content"], variables)
+            filled_template = _render_content(template["content"], variables)
             
             # Parse filled template as JSON
-            result = json.loads(filled_template)
+            result = _json_loads(filled_template)
             
             return result
         except Exception as e:
-            logger.error(f"Error filling structured template: {str(e)}")
+            logger.error("Error filling structured template: %s", e)
             raise ValueError(f"Error filling structured template: {str(e)}")
     
-    def _get_templates_dir(self) -> str:
-        """Gets the templates directory.
+    @classmethod
+    def _get_templates_dir(cls) -> str:
+        """Gets the templates directory, creating it if needed.
+        
+        The path is resolved on the first call and reused afterwards.
         
         Returns:
             Path to the templates directory
         """
-        # Project base directory
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        
-        # Templates directory
-        templates_dir = os.path.join(base_dir, "prompt", "templates")
-        
-        # Check if the directory exists
-        if not os.path.exists(templates_dir):
-            logger.warning(f"Templates directory not found: {templates_dir}")
+        if cls._templates_dir is None:
+            # Project base directory
+            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            
+            # Templates directory; makedirs is a no-op when it already exists
+            templates_dir = os.path.join(base_dir, "prompt", "templates")
             os.makedirs(templates_dir, exist_ok=True)
+            cls._templates_dir = templates_dir
         
-        return templates_dir
+        return cls._templates_dir
     
     def _load_templates_from_disk(self) -> List[Dict[str, Any]]:
         """Loads templates from disk without performing intent analysis.
@@ -255,42 +726,127 @@ class TemplateManager:
         Returns:
             List of templates loaded from disk
         """
-        # If templates already exist in session_state and have content, we can use them
-        if 'tm_templates' in st.session_state and len(st.session_state.tm_templates) > 0 and self.skip_intent_analysis:
-            logger.info(f"Using existing templates from session_state (total: {len(st.session_state.tm_templates)})")
-            return st.session_state.tm_templates
-            
-        logger.info(f"Attempting to load templates from: {self.templates_dir}")
-        logger.info(f"Current working directory: {os.getcwd()}")
+        logger.info("Attempting to load templates from: %s", self.templates_dir)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Current working directory: %s", os.getcwd())
         
-        # Check if directory exists and list its contents
-        if not os.path.exists(self.templates_dir):
-            logger.error(f"Templates directory not found: {self.templates_dir}")
-            logger.error(f"Directory contents: {os.listdir(os.path.dirname(self.templates_dir)) if os.path.exists(os.path.dirname(self.templates_dir)) else 'Parent directory does not exist'}")
-            return []
+        return self._load_templates_cached()
+    
+    def _load_templates_cached(self) -> List[Dict[str, Any]]:
+        """Loads templates from the JSON cache, re-parsing the YAML files when it is stale.
+        
+        The cache is valid while it is newer than every template file and was
+        written for the same set of files and the same cache version.
+        
+        Returns:
+            List of templates loaded from disk
+        """
+        cache_path = os.path.join(self.templates_dir, TEMPLATE_CACHE_FILE)
         
-        # Log directory contents
+        # One directory read; DirEntry carries the full path and caches its stat() result
         try:
-            dir_contents = os.listdir(self.templates_dir)
-            logger.info(f"Found {len(dir_contents)} items in templates directory: {dir_contents}")
+            with os.scandir(self.templates_dir) as entries:
+                yaml_entries = sorted(
+                    (e for e in entries if e.name.endswith((".yaml", ".yml")) and e.is_file()),
+                    key=lambda e: e.name
+                )
+            newest_mtime = max((e.stat().st_mtime_ns for e in yaml_entries), default=0)
+        except FileNotFoundError:
+            # Listing the parent directory is a syscall made only for the log message
+            if logger.isEnabledFor(logging.ERROR):
+                parent_dir = os.path.dirname(self.templates_dir)
+                logger.error(
+                    "Templates directory not found: %s (parent contents: %s)", self.templates_dir,
+                    os.listdir(parent_dir) if os.path.exists(parent_dir) else "parent directory does not exist"
+                )
+            return []
         except Exception as e:
-            logger.error(f"Error listing directory contents: {str(e)}")
+            logger.error("Error listing directory contents: %s", e)
             return []
         
+        filenames = [e.name for e in yaml_entries]
+        logger.debug("Found %d template files in templates directory: %s", len(filenames), filenames)
+        
+        try:
+            if os.stat(cache_path).st_mtime_ns >= newest_mtime:
+                with open(cache_path, 'rb') as f:
+                    cached = _json_loads(f.read())
+                if cached.get("_schema_version") == TEMPLATE_CACHE_VERSION and cached.get("files") == filenames:
+                    logger.info("Loaded %d templates from cache: %s", len(cached["templates"]), cache_path)
+                    return cached["templates"]
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+        
+        loaded_templates = self._parse_template_files(yaml_entries)
+        
+        # Write the cache for the next load; failures only cost the speedup
+        try:
+            content = _json_dumps(
+                {"_schema_version": TEMPLATE_CACHE_VERSION, "files": filenames, "templates": loaded_templates}
+            )
+            # JSON turns YAML dates and non-string keys into strings; templates with such
+            # values are always parsed from YAML, so a cache hit returns the same data as a fresh load
+            if _json_loads(content)["templates"] != loaded_templates:
+                logger.debug("Templates do not round-trip through JSON; not writing cache %s", cache_path)
+                return loaded_templates
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Could not write template cache %s: %s", cache_path, e)
+        
+        return loaded_templates
+    
+    def _parse_template_files(self, entries: List[os.DirEntry]) -> List[Dict[str, Any]]:
+        """Parses YAML template files into template dicts.
+        
+        Args:
+            entries: Directory entries of the YAML files to parse
+            
+        Returns:
+            List of parsed templates
+        """
         # List to store loaded templates
         loaded_templates = []
         
-        # Process each YAML file in the templates directory
-        for filename in dir_contents:
-            if not filename.endswith(".yaml") and not filename.endswith(".yml"):
-                continue
-                
-            file_path = os.path.join(self.templates_dir, filename)
-            logger.info(f"Processing template file: {file_path}")
+        # Files unchanged since this process last parsed them are not parsed again
+        mtimes = {entry.path: entry.stat().st_mtime_ns for entry in entries}
+        results: Dict[str, Callable[[], Any]] = {}
+        pending = []
+        for entry in entries:
+            cached = self._yaml_cache.get(entry.path)
+            if cached is not None and cached[0] == mtimes[entry.path]:
+                results[entry.path] = functools.partial(copy.deepcopy, cached[1])
+            else:
+                pending.append(entry)
+        
+        # Each result is a callable returning the parsed data or raising the read/parse error
+        cpu_count = os.cpu_count() or 1
+        reader = None
+        if PARALLEL_YAML and len(pending) >= PARALLEL_YAML_MIN_FILES and cpu_count >= 2:
+            with ProcessPoolExecutor(max_workers=min(4, cpu_count)) as executor:
+                futures = [(entry.path, executor.submit(_parse_yaml_file, entry.path)) for entry in pending]
+            results.update((path, future.result) for path, future in futures)
+        elif pending:
+            # Parse here, in order, while reader threads fetch the next files (the GIL is released during reads);
+            # small directories don't pay off the process start-up cost
+            reader = ThreadPoolExecutor(max_workers=min(4, len(pending)))
+            results.update(
+                (entry.path, functools.partial(_parse_yaml_read, reader.submit(_read_file, entry.path)))
+                for entry in pending
+            )
+        
+        for entry in entries:
+            filename = entry.name
+            file_path = entry.path
+            logger.debug("Processing template file: %s", file_path)
             
             try:
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    template_data = yaml.safe_load(file)
+                template_data = results[file_path]()
+                if file_path not in self._yaml_cache or self._yaml_cache[file_path][0] != mtimes[file_path]:
+                    self._yaml_cache[file_path] = (mtimes[file_path], copy.deepcopy(template_data))
                 
                 template_id = template_data.get("id", os.path.splitext(filename)[0])
                 template_name = template_data.get("name", template_id)
@@ -301,16 +857,18 @@ class TemplateManager:
                     "name": template_name,
                     "type": template_type,
                     "content": template_data.get("content", ""),
-                    "variables": [param.get("name") for param in template_data.get("parameters", [])],
+                    "variables": [param["name"] for param in template_data.get("parameters") or () if "name" in param],
                     "description": template_data.get("description", ""),
                     "status": "Active",
-                    "category": template_data.get("metadata", {}).get("domain", "general")
+                    "category": template_data.get("metadata", {}).get("domain", "general"),
+                    # Removed before the templates are handed out, see _build_templates()
+                    "_source_path": file_path
                 }
                 
                 # Check if intent_info already exists in the YAML file
                 if "intent_info" in template_data:
                     template["intent_info"] = template_data["intent_info"]
-                    logger.info(f"Using predefined intent info for template {template_id}: {template['intent_info']}")
+                    logger.debug("Using predefined intent info for template %s: %s", template_id, template["intent_info"])
                 else:
                     # Initialize with empty intent_info to be filled later
                     template["intent_info"] = {
@@ -320,52 +878,159 @@ class TemplateManager:
                     }
                 
                 loaded_templates.append(template)
-                logger.info(f"Successfully loaded template from disk: {template_name} (ID: {template_id}, Type: {template['type']})")
+                logger.debug("Successfully loaded template from disk: %s (ID: %s, Type: %s)", template_name, template_id, template["type"])
                 
             except yaml.YAMLError as e:
-                logger.error(f"YAML parsing error in {filename}: {str(e)}")
+                logger.error("YAML parsing error in %s: %s", filename, e)
             except Exception as e:
-                logger.error(f"Error loading template {filename}: {str(e)}", exc_info=True)
+                logger.error("Error loading template %s: %s", filename, e, exc_info=True)
         
-        logger.info(f"Total templates loaded from disk: {len(loaded_templates)}")
+        if reader is not None:
+            reader.shutdown()
+        
+        logger.info("Total templates loaded from disk: %d", len(loaded_templates))
         return loaded_templates
         
 
     
-    def _analyze_templates(self, templates: List[Dict[str, Any]]) -> None:
+    def _analyze_templates(self, templates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Analyze templates using LLM to extract intent information.
         
         Args:
             templates: List of templates to analyze
+            
+        Returns:
+            List of analyzed templates
         """
         if not templates:
             logger.warning("No templates to analyze")
-            self.templates = []
-            return
+            return []
             
-        analyzed_templates = []
+        # Templates without intent_info still need the analysis
+        todo = [t for t in templates if t.get("intent_info", _PENDING_INTENT).get("intent") == "unknown"]
+        if not todo:
+            logger.info("All %d templates already have intent info", len(templates))
+            return templates
         
-        for template in templates:
-            template_id = template.get("id", "unknown")
+        # Each analysis is an independent, latency-bound LLM call, so run them concurrently
+        with ThreadPoolExecutor(max_workers=min(LLM_PARALLELISM, len(todo))) as executor:
+            futures = {}
+            for template in todo:
+                logger.debug("Analyzing template %s with LLM to extract intent information", template.get("id", "unknown"))
+                futures[executor.submit(self.analyze_template_with_llm, template)] = template
             
-            # If already has complete intent_info, no need to analyze
-            if "intent_info" in template and template.get("intent_info", {}).get("intent") != "unknown":
-                logger.info(f"Template {template_id} already has intent info: {template['intent_info']}")
-                analyzed_templates.append(template)
-                continue
-                
-            # Analyze template with LLM to extract intent information
-            logger.info(f"Analyzing template {template_id} with LLM to extract intent information")
-            intent_info = self.analyze_template_with_llm(template)
-            template["intent_info"] = intent_info
+            for future in as_completed(futures):
+                template = futures[future]
+                template_id = template.get("id", "unknown")
+                try:
+                    template["intent_info"] = future.result()
+                    logger.debug(
+                        "Successfully analyzed template: %s (ID: %s, Intent: %s)",
+                        template["name"], template_id, template["intent_info"].get("intent", "unknown")
+                    )
+                except Exception as e:
+                    logger.error("Intent analysis failed for %s: %s", template_id, e)
+                    template["intent_info"] = {
+                        "intent": "unknown",
+                        "keywords": [],
+                        "description": f"Error: {str(e)}"
+                    }
+        
+        # Persist the new analyses once for the whole batch
+        self._save_intent_cache()
+        if self.persist_intent_analysis:
+            self._write_intent_info(
+                [t for t in todo if t["intent_info"].get("intent", "unknown") != "unknown"]
+            )
+        
+        # Templates were updated in place and keep their original order
+        logger.info("Total templates analyzed: %d of %d", len(todo), len(templates))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Template IDs: %s", [t["id"] for t in todo])
+        return templates
+    
+    @staticmethod
+    def _intent_cache_key(template: Dict[str, Any]) -> str:
+        """Gets the intent cache key of a template.
+        
+        Args:
+            template: Template to get the key for
             
-            analyzed_templates.append(template)
-            logger.info(f"Successfully analyzed template: {template['name']} (ID: {template_id}, Intent: {template['intent_info'].get('intent', 'unknown')})")
+        Returns:
+            SHA-256 hex digest of the template ID and content
+        """
+        data = str(template.get("id", "")) + (template.get("content") or "")
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+    
+    def _get_intent_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Gets the intent analysis cache, loading it from disk on first use.
         
-        # Update analyzed templates
-        self.templates = analyzed_templates
-        logger.info(f"Total templates analyzed: {len(analyzed_templates)}")
-        logger.info(f"Template IDs: {[t['id'] for t in analyzed_templates]}")
+        Returns:
+            Dict mapping intent cache keys to intent information
+        """
+        with self._intent_cache_lock:
+            if self._intent_cache is None:
+                cache_path = os.path.join(self.templates_dir, INTENT_CACHE_FILE)
+                try:
+                    with open(cache_path, 'rb') as f:
+                        self._intent_cache = _json_loads(f.read())
+                except FileNotFoundError:
+                    self._intent_cache = {}
+                except (OSError, ValueError) as e:
+                    logger.warning("Ignoring unreadable intent cache %s: %s", cache_path, e)
+                    self._intent_cache = {}
+            return self._intent_cache
+    
+    def _save_intent_cache(self) -> None:
+        """Writes the intent analysis cache to disk if it has new entries."""
+        with self._intent_cache_lock:
+            if not self._intent_cache_dirty:
+                return
+            cache_path = os.path.join(self.templates_dir, INTENT_CACHE_FILE)
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(_json_dumps(self._intent_cache))
+                os.replace(tmp_path, cache_path)
+                self._intent_cache_dirty = False
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning("Could not write intent cache %s: %s", cache_path, e)
+    
+    def _write_intent_info(self, templates: List[Dict[str, Any]]) -> None:
+        """Writes analyzed intent information back into the template source files.
+        
+        The intent_info block is appended to the YAML text, which keeps the rest
+        of the file (including comments) untouched. Files that already define
+        intent_info are left alone.
+        
+        Args:
+            templates: Analyzed templates loaded from disk
+        """
+        for template in templates:
+            source_path = template.get("_source_path")
+            if not source_path:
+                continue
+            try:
+                with open(source_path, 'r', encoding='utf-8') as f:
+                    text = f.read()
+                data = yaml.load(text, Loader=_YAML_LOADER)
+                if not isinstance(data, dict) or "intent_info" in data:
+                    continue
+                
+                if text and not text.endswith("\n"):
+                    text += "\n"
+                text += yaml.safe_dump(
+                    {"intent_info": template["intent_info"]},
+                    allow_unicode=True, sort_keys=False, default_flow_style=False
+                )
+                tmp_path = f"{source_path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                os.replace(tmp_path, source_path)
+                logger.info("Saved intent info for template %s to %s", template["id"], source_path)
+            except (OSError, yaml.YAMLError) as e:
+                logger.warning("Could not save intent info for template %s: %s", template["id"], e)
     
     def analyze_template_with_llm(self, template: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze a template using LLM to extract intent information.
@@ -376,31 +1041,20 @@ class TemplateManager:
         Returns:
             Dict with extracted intent information
         """
-        prompt = f"""
-        Analise o seguinte template de resposta e extraia:
-        1. A intenção principal que este template atende (use snake_case em inglês, ex: explain_term, list_terms, create_literature_summary)
-        2. Palavras-chave relevantes para identificar esta intenção em PORTUGUÊS (5-10 palavras)
-        3. Palavras-chave relevantes para identificar esta intenção em INGLÊS (5-10 palavras)
-        4. Padrões de frases em PORTUGUÊS que um usuário poderia usar para ativar esta intenção (3-5 padrões)
-        5. Padrões de frases em INGLÊS que um usuário poderia usar para ativar esta intenção (3-5 padrões)
-        6. Tipos de entidades que são esperadas para este template (ex: termo_medico, medicamento)
-
-        Template ID: {template.get('id', 'unknown')}
-        Template Name: {template.get('name', 'unknown')}
-        Template Content:
-        {template.get('content', '')}
-
-        Responda em formato JSON com os seguintes campos:
-        {{
-            "intent": "intenção_principal",
-            "keywords_language": ["pt", "en"],
-            "keywords_pt": ["palavra1", "palavra2", "..."],
-            "keywords_en": ["word1", "word2", "..."],
-            "patterns_pt": ["padrão 1", "padrão 2", "..."],
-            "patterns_en": ["pattern 1", "pattern 2", "..."],
-            "entities": ["entidade1", "entidade2", "..."]
-        }}
-        """
+        # The analysis only depends on the template ID and content
+        cache_key = self._intent_cache_key(template)
+        intent_cache = self._get_intent_cache()
+        cached = intent_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Using cached intent analysis for template %s", template.get("id", "unknown"))
+            return dict(cached)
+        
+        prompt = (
+            f"{INTENT_PROMPT_PREFIX}\n"
+            f"Template ID: {template.get('id', 'unknown')}\n"
+            f"Template Name: {template.get('name', 'unknown')}\n"
+            f"Template Content:\n{template.get('content', '')}\n"
+        )
         
         try:
             # Generate structured content using the LLM
@@ -412,17 +1066,20 @@ class TemplateManager:
                 result["keywords"] = result.get("keywords_pt", []) + result.get("keywords_en", [])
                 result["patterns"] = result.get("patterns_pt", []) + result.get("patterns_en", [])
                 
-                logger.info(f"LLM analysis for template {template.get('id', 'unknown')}: {result}")
-                return result
+                logger.debug("LLM analysis for template %s: %s", template.get("id", "unknown"), result)
+                with self._intent_cache_lock:
+                    intent_cache[cache_key] = result
+                    self._intent_cache_dirty = True
+                return dict(result)
             else:
-                logger.error(f"Invalid LLM response format: {result}")
+                logger.error("Invalid LLM response format: %s", result)
                 return {
                     "intent": "unknown",
                     "keywords": [],
                     "description": "Failed to analyze intent"
                 }
         except Exception as e:
-            logger.error(f"Error analyzing template with LLM: {str(e)}")
+            logger.error("Error analyzing template with LLM: %s", e)
             return {
                 "intent": "unknown",
                 "keywords": [],
@@ -441,36 +1098,27 @@ class TemplateManager:
         Returns:
             Generated content
         """
-        # Preparar parâmetros baseados no conceito
-        parameters = {
-            "concept_name": concept.get("name", ""),
-            "concept_description": concept.get("description", ""),
-            "concept_type": concept.get("type", ""),
-            "concept_properties": concept.get("properties", {})
-        }
-        
         # Generate content using the template
         # Note: LLMPromptManager.fill_and_generate doesn't accept temperature and max_tokens
         # Let's fill the template manually and use the LLM directly
         
-        # Preencher o template usando string.format()
         template_content = template.get("content", "")
         try:
-            # Substituir variáveis no formato {{var}} por seus valores
-            for key, value in parameters.items():
-                placeholder = "{{" + key + "}}"
-                template_content = template_content.replace(placeholder, str(value))
+            # Substituir variáveis no formato {{var}} por seus valores com o template compilado;
+            # placeholders sem parâmetro ficam como estão. Sem "{" não há placeholders nem parâmetros a preparar
+            if "{" in template_content:
+                parameters = {k: _stringify(v) for k, v in concept_parameters(concept).items()}
+                template_content = _render_content(template_content, parameters)
                 
             # Adicionar instruções de temperatura no prompt, já que não podemos passar como parâmetro
-            if temperature > 0.7:
-                template_content = f"Instrução: Seja criativo e variável em suas respostas.\n\n{template_content}"
-            elif temperature < 0.3:
-                template_content = f"Instrução: Seja conciso e direto em suas respostas.\n\n{template_content}"
+            prefix = _TEMPERATURE_PREFIXES[bisect.bisect_right(_TEMPERATURE_BOUNDS, temperature)]
+            if prefix:
+                template_content = prefix + template_content
                 
             # Generate text using the LLM (without extra parameters that are not supported)
             return self.llm.generate_text(template_content)
         except Exception as e:
-            logger.error(f"Error filling template: {str(e)}")
+            logger.error("Error filling template: %s", e)
             raise ValueError(f"Error filling template: {str(e)}")
             
     def generate_structured(self, template: Dict[str, Any], concept: Dict[str, Any], temperature: float = 0.7, max_tokens: int = 500) -> Dict[str, Any]:
@@ -489,10 +1137,8 @@ class TemplateManager:
         # Esta é uma implementação básica que pode ser expandida conforme necessário
         
         try:
-            # Preencher o template e gerar conteúdo estruturado
-            template_id = template.get("id") or template.get("template_id")
-            filled_template = self.fill_structured_template(template_id, concept)
-            return filled_template
+            # Preencher o template recebido diretamente, sem buscá-lo de novo pelo ID
+            return _json_loads(_render_content(template["content"], concept))
         except Exception as e:
-            logger.error(f"Error generating structured content: {str(e)}")
+            logger.error("Error generating structured content: %s", e)
             return {"error": str(e)}
@@ -6,52 +6,209 @@ Validator for prompt templates in MedKnowBridge.
 Ensures that templates follow the expected schema and contain all required fields.
 """
 
+import copy
+import hashlib
 import logging
 import os
+import re
+import threading
 import yaml
 import json
-import jsonschema
-from typing import Dict, List, Any, Optional, Union
+from jsonschema import Draft7Validator as _Draft7Validator
+from jsonschema.exceptions import ValidationError as _ValidationError
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Callable, Dict, List, Any, Mapping, Optional, Tuple, Union
+
+# Prefer the libyaml-backed loader (several times faster) when PyYAML was built with it;
+# install libyaml (e.g. libyaml-dev) before PyYAML to get it
+try:
+    from yaml import CSafeLoader as _YAML_LOADER
+except ImportError:
+    from yaml import SafeLoader as _YAML_LOADER
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import jsonschema_rs
+except ImportError:
+    jsonschema_rs = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 logger = logging.getLogger(__name__)
 
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the same error
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Canonical JSON of a template. Values JSON can only approximate (dates, UUIDs, enums,
+# tuples, ...) make it raise TypeError, so two templates never share a key unless they
+# are equal to the same plain JSON document
+if orjson is not None:
+    _CANONICAL_OPTIONS = (
+        orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+    
+    def _dump_canonical(data: Any) -> bytes:
+        return orjson.dumps(data, option=_CANONICAL_OPTIONS)
+else:
+    def _dump_canonical(data: Any) -> bytes:
+        return json.dumps(data, sort_keys=True).encode("utf-8")
+
+def _canonical_json(data: Any) -> bytes:
+    canonical = _dump_canonical(data)
+    # Catches what the serializer still converts silently, e.g. UUIDs, enums and tuples
+    if _json_loads(canonical) != data:
+        raise TypeError("Template has values without an exact JSON form")
+    return canonical
+
+# Maximum number of validated template files kept by PromptValidator.validate_template_file
+FILE_CACHE_SIZE = 128
+
+# Python types accepted for each parameter type of the schema, and its name in error messages
+_TYPE_MAP: Dict[str, Tuple[Any, str]] = {
+    "string": (str, "a string"),
+    "number": ((int, float), "a number"),
+    "boolean": (bool, "a boolean"),
+    "array": (list, "an array"),
+    "object": (dict, "an object"),
+}
+
+# Maximum number of validated template digests kept by PromptValidator.validate_template
+VALIDATED_CACHE_SIZE = 256
+
+# Minimum number of files before validate_template_dir uses worker threads
+PARALLEL_VALIDATION_MIN_FILES = 4
+
+# YAML template files from this size are parsed from the open file instead of one read
+STREAM_PARSE_MIN_SIZE = 64 * 1024
+
+# Parameter reference in a template string, e.g. {concept_name}
+_PARAM_RE = re.compile(r'\{([^{}]+)\}')
+
+# Base schema for prompt templates; validators are compiled from this dict once per process
+_BASE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["template_id", "description", "template", "parameters"],
+    "properties": {
+        "template_id": {"type": "string"},
+        "description": {"type": "string"},
+        "template": {"type": "string"},
+        "parameters": {
+            "type": "object",
+            "additionalProperties": {
+                "type": "object",
+                "required": ["type", "description"],
+                "properties": {
+                    "type": {"type": "string", "enum": ["string", "number", "boolean", "array", "object"]},
+                    "description": {"type": "string"},
+                    "required": {"type": "boolean"},
+                    "default": {}
+                }
+            }
+        },
+        "examples": {
+            "type": "array",
+            "items": {"type": "object"}
+        }
+    }
+}
+
+# Read-only view shared by every PromptValidator, so the compiled validators always match it
+BASE_SCHEMA: Mapping[str, Any] = MappingProxyType(_BASE_SCHEMA)
+
+
 class PromptValidator:
     """
     Validator for prompt templates.
     Ensures that templates follow the expected schema and contain all required fields.
     """
     
-    def __init__(self):
+    # Fixed attribute set: no per-instance __dict__ (instances may be created per request)
+    __slots__ = (
+        "base_schema", "_validator", "_rs_validator", "_fast_validate",
+        "_file_cache", "_validated_hashes", "_cache_lock",
+    )
+    
+    # Compiled BASE_SCHEMA validator shared by all instances, built on first use
+    _shared_validator: Optional[_Draft7Validator] = None
+    _shared_validator_lock = threading.Lock()
+    # BASE_SCHEMA compiled by jsonschema-rs (native) or fastjsonschema (generated Python), when installed
+    _shared_rs_validator: Optional[Any] = None
+    _shared_fast_validate: Optional[Callable[[Any], Any]] = None
+    
+    def __init__(self, use_fast: bool = True):
         """
         Initializes the prompt validator with the base schema.
+        
+        Args:
+            use_fast: Check templates with jsonschema-rs or fastjsonschema when one is installed
         """
-        # Define the base schema for prompt templates
-        self.base_schema = {
-            "type": "object",
-            "required": ["template_id", "description", "template", "parameters"],
-            "properties": {
-                "template_id": {"type": "string"},
-                "description": {"type": "string"},
-                "template": {"type": "string"},
-                "parameters": {
-                    "type": "object",
-                    "additionalProperties": {
-                        "type": "object",
-                        "required": ["type", "description"],
-                        "properties": {
-                            "type": {"type": "string", "enum": ["string", "number", "boolean", "array", "object"]},
-                            "description": {"type": "string"},
-                            "required": {"type": "boolean"},
-                            "default": {}
-                        }
-                    }
-                },
-                "examples": {
-                    "type": "array",
-                    "items": {"type": "object"}
-                }
-            }
-        }
+        # Shared schema; the compiled validators below are built from it once per process
+        self.base_schema = BASE_SCHEMA
+        self._validator = self._get_validator()
+        self._rs_validator = self._get_rs_validator() if use_fast and jsonschema_rs is not None else None
+        self._fast_validate = (
+            self._get_fast_validate()
+            if use_fast and self._rs_validator is None and fastjsonschema is not None else None
+        )
+        # Validated templates by path, with the (mtime_ns, size) of the file they were read from
+        self._file_cache: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+        # Digests of the canonical JSON of templates that passed validate_template
+        self._validated_hashes: "OrderedDict[bytes, None]" = OrderedDict()
+        # Guards both caches, which validate_template_dir updates from worker threads
+        self._cache_lock = threading.Lock()
+        
+    @classmethod
+    def _get_validator(cls) -> _Draft7Validator:
+        """
+        Gets the compiled base schema validator, checking the schema only once.
+        
+        Returns:
+            Validator for BASE_SCHEMA
+        """
+        if cls._shared_validator is None:
+            with cls._shared_validator_lock:
+                if cls._shared_validator is None:
+                    _Draft7Validator.check_schema(_BASE_SCHEMA)
+                    cls._shared_validator = _Draft7Validator(_BASE_SCHEMA)
+        return cls._shared_validator
+    
+    @classmethod
+    def _get_rs_validator(cls) -> Any:
+        """
+        Gets the jsonschema-rs validator for the base schema, building it only once.
+        
+        Returns:
+            jsonschema-rs validator for BASE_SCHEMA
+        """
+        if cls._shared_rs_validator is None:
+            with cls._shared_validator_lock:
+                if cls._shared_rs_validator is None:
+                    cls._shared_rs_validator = jsonschema_rs.validator_for(_BASE_SCHEMA)
+        return cls._shared_rs_validator
+    
+    @classmethod
+    def _get_fast_validate(cls) -> Callable[[Any], Any]:
+        """
+        Gets the fastjsonschema validation function for the base schema, compiling it only once.
+        
+        Returns:
+            Function that raises fastjsonschema.JsonSchemaException for invalid templates
+        """
+        if cls._shared_fast_validate is None:
+            with cls._shared_validator_lock:
+                if cls._shared_fast_validate is None:
+                    cls._shared_fast_validate = fastjsonschema.compile(_BASE_SCHEMA)
+        return cls._shared_fast_validate
         
     def validate_template_file(self, template_path: str) -> Dict[str, Any]:
         """
@@ -68,43 +225,113 @@ class PromptValidator:
             yaml.YAMLError: If template file is not valid YAML
             jsonschema.exceptions.ValidationError: If template doesn't match schema
         """
-        if not os.path.exists(template_path):
+        # One open both reports a missing file (no separate exists check to race with)
+        # and gives the descriptor whose stat keys the file cache
+        try:
+            f = open(template_path, 'rb')
+        except FileNotFoundError:
             error_msg = f"Template file not found: {template_path}"
             logger.error(error_msg)
-            raise FileNotFoundError(error_msg)
-            
-        # Determine file type from extension
-        _, ext = os.path.splitext(template_path)
+            raise FileNotFoundError(error_msg) from None
         
-        try:
-            # Load template from file
-            with open(template_path, 'r') as f:
-                if ext.lower() in ['.yaml', '.yml']:
-                    template = yaml.safe_load(f)
-                elif ext.lower() == '.json':
-                    template = json.load(f)
+        with f:
+            # An unchanged file was already parsed and validated; copies keep the cached template intact
+            stat = os.fstat(f.fileno())
+            with self._cache_lock:
+                cached = self._file_cache.get(template_path)
+                if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                    self._file_cache.move_to_end(template_path)
                 else:
+                    cached = None
+            if cached is not None:
+                logger.debug("Template file unchanged since last validation: %s", template_path)
+                return copy.deepcopy(cached[2])
+                
+            # Determine file type from extension
+            _, ext = os.path.splitext(template_path)
+            
+            try:
+                ext = ext.lower()
+                if ext not in ('.yaml', '.yml', '.json'):
                     error_msg = f"Unsupported template file format: {ext}"
                     logger.error(error_msg)
                     raise ValueError(error_msg)
-                    
-            # Validate template against schema
-            self.validate_template(template)
-            
-            logger.info(f"Template validated successfully: {template_path}")
-            return template
-        except yaml.YAMLError as e:
-            error_msg = f"Invalid YAML in template file: {e}"
-            logger.error(error_msg)
-            raise
-        except json.JSONDecodeError as e:
-            error_msg = f"Invalid JSON in template file: {e}"
-            logger.error(error_msg)
-            raise
-        except Exception as e:
-            error_msg = f"Error validating template file: {e}"
-            logger.error(error_msg)
-            raise
+                
+                # Load template from file: one binary read, parsed without text decoding in Python.
+                # PyYAML reads a stream in chunks, so large YAML files are never held in full
+                # next to the template parsed from them (JSON parsers need the whole buffer)
+                if ext != '.json' and stat.st_size >= STREAM_PARSE_MIN_SIZE:
+                    template = yaml.load(f, Loader=_YAML_LOADER)
+                else:
+                    data = f.read()
+                    template = _json_loads(data) if ext == '.json' else yaml.load(data, Loader=_YAML_LOADER)
+                        
+                # Validate template against schema
+                self.validate_template(template)
+                
+                logger.info(f"Template validated successfully: {template_path}")
+                entry = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(template))
+                with self._cache_lock:
+                    self._file_cache[template_path] = entry
+                    if len(self._file_cache) > FILE_CACHE_SIZE:
+                        self._file_cache.popitem(last=False)
+                return template
+            except yaml.YAMLError as e:
+                error_msg = f"Invalid YAML in template file: {e}"
+                logger.error(error_msg)
+                raise
+            except json.JSONDecodeError as e:
+                error_msg = f"Invalid JSON in template file: {e}"
+                logger.error(error_msg)
+                raise
+            except Exception as e:
+                error_msg = f"Error validating template file: {e}"
+                logger.error(error_msg)
+                raise
+            
+    def validate_template_dir(self, dir_path: str) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+        """
+        Validates every template file (YAML or JSON) in a directory.
+        
+        All files share this validator's compiled schema and file cache; larger
+        directories are read, parsed and validated by worker threads, which overlap
+        the file reads (the validation itself still holds the GIL).
+        
+        Args:
+            dir_path: Path to the templates directory
+            
+        Returns:
+            Tuple of the validated templates and the error messages of the invalid files,
+            both keyed by file path
+        """
+        with os.scandir(dir_path) as entries:
+            paths = sorted(
+                entry.path for entry in entries
+                if entry.name.lower().endswith(('.yaml', '.yml', '.json')) and entry.is_file()
+            )
+        
+        def validate(path: str) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+            try:
+                return path, self.validate_template_file(path), None
+            except Exception as e:
+                return path, None, str(e)
+        
+        if len(paths) > PARALLEL_VALIDATION_MIN_FILES:
+            with ThreadPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as executor:
+                results = list(executor.map(validate, paths))
+        else:
+            results = [validate(path) for path in paths]
+        
+        templates: Dict[str, Dict[str, Any]] = {}
+        errors: Dict[str, str] = {}
+        for path, template, error in results:
+            if error is None:
+                templates[path] = template
+            else:
+                errors[path] = error
+        
+        logger.info(f"Validated {len(templates)} of {len(paths)} template files in {dir_path}")
+        return templates, errors
             
     def validate_template(self, template: Dict[str, Any]) -> None:
         """
@@ -116,17 +343,59 @@ class PromptValidator:
         Raises:
             jsonschema.exceptions.ValidationError: If template doesn't match schema
         """
+        # Validation is a pure function of the template, so an identical template passed before
+        try:
+            key = hashlib.blake2b(_canonical_json(template), digest_size=16).digest()
+        except (TypeError, ValueError):
+            key = None
+        if key is not None:
+            with self._cache_lock:
+                if key in self._validated_hashes:
+                    self._validated_hashes.move_to_end(key)
+                    return
+        
         try:
-            jsonschema.validate(instance=template, schema=self.base_schema)
+            # The yes/no check builds no error objects; only an invalid template goes through
+            # jsonschema again to raise the detailed ValidationError callers expect
+            if not self.is_valid_template(template):
+                self._validator.validate(template)
             
             # Additional validation for parameter references in template
             self._validate_parameter_references(template)
             
-        except jsonschema.exceptions.ValidationError as e:
+            if key is not None:
+                with self._cache_lock:
+                    self._validated_hashes[key] = None
+                    if len(self._validated_hashes) > VALIDATED_CACHE_SIZE:
+                        self._validated_hashes.popitem(last=False)
+            
+        except _ValidationError as e:
             error_msg = f"Template validation failed: {e.message}"
             logger.error(error_msg)
             raise
             
+    def is_valid_template(self, template: Dict[str, Any]) -> bool:
+        """
+        Checks a template against the schema without building error details.
+        
+        Parameter references are not checked; use validate_template for that.
+        
+        Args:
+            template: Template to check
+            
+        Returns:
+            True if the template matches the schema, False otherwise
+        """
+        if self._rs_validator is not None:
+            return self._rs_validator.is_valid(template)
+        if self._fast_validate is not None:
+            try:
+                self._fast_validate(template)
+                return True
+            except fastjsonschema.JsonSchemaException:
+                return False
+        return self._validator.is_valid(template)
+            
     def _validate_parameter_references(self, template: Dict[str, Any]) -> None:
         """
         Validates that all parameter references in the template string exist in the parameters object.
@@ -141,15 +410,19 @@ class PromptValidator:
         parameters = template.get("parameters", {})
         
         # Find all parameter references in the template string
-        import re
-        param_refs = set(re.findall(r'\{([^{}]+)\}', template_str))
+        # findall builds the strings in C; faster than finditer match objects or a str.find scanner.
+        # A string without "{" has no references, and the memchr-based "in" check skips the regex
+        param_refs = set(_PARAM_RE.findall(template_str)) if "{" in template_str else set()
         
-        # Check that all referenced parameters are defined
-        undefined_params = param_refs - set(parameters.keys())
+        # Check that all referenced parameters are defined (the keys view is already set-like)
+        undefined_params = param_refs - parameters.keys()
         if undefined_params:
             error_msg = f"Template contains references to undefined parameters: {', '.join(undefined_params)}"
             logger.error(error_msg)
             raise ValueError(error_msg)
+        
+        if not parameters:
+            return
             
         # Check that all required parameters are referenced
         required_params = {name for name, param in parameters.items() 
@@ -171,11 +444,23 @@ class PromptValidator:
         """
         template_params = template.get("parameters", {})
         
-        # Check for missing required parameters
+        # One pass over the template parameters finds missing required ones and type errors
         missing_params = []
+        type_errors = []
         for name, param_schema in template_params.items():
-            if param_schema.get("required", False) and name not in parameters:
-                missing_params.append(name)
+            if name not in parameters:
+                if param_schema.get("required", False):
+                    missing_params.append(name)
+                continue
+            param_type = param_schema.get("type")
+            check = _TYPE_MAP.get(param_type)
+            if check is None:
+                continue
+            value = parameters[name]
+            expected, type_name = check
+            # bool is a subclass of int, but True is not a number parameter
+            if not isinstance(value, expected) or (param_type == "number" and isinstance(value, bool)):
+                type_errors.append(f"{name} should be {type_name}")
                 
         if missing_params:
             error_msg = f"Missing required parameters: {', '.join(missing_params)}"
@@ -183,26 +468,10 @@ class PromptValidator:
             raise ValueError(error_msg)
             
         # Check for unexpected parameters
-        unexpected_params = set(parameters.keys()) - set(template_params.keys())
+        unexpected_params = parameters.keys() - template_params.keys()
         if unexpected_params:
             logger.warning(f"Unexpected parameters provided: {', '.join(unexpected_params)}")
             
-        # Validate parameter types
-        type_errors = []
-        for name, value in parameters.items():
-            if name in template_params:
-                param_type = template_params[name].get("type")
-                if param_type == "string" and not isinstance(value, str):
-                    type_errors.append(f"{name} should be a string")
-                elif param_type == "number" and not isinstance(value, (int, float)):
-                    type_errors.append(f"{name} should be a number")
-                elif param_type == "boolean" and not isinstance(value, bool):
-                    type_errors.append(f"{name} should be a boolean")
-                elif param_type == "array" and not isinstance(value, list):
-                    type_errors.append(f"{name} should be an array")
-                elif param_type == "object" and not isinstance(value, dict):
-                    type_errors.append(f"{name} should be an object")
-                    
         if type_errors:
             error_msg = f"Parameter type errors: {'; '.join(type_errors)}"
             logger.error(error_msg)
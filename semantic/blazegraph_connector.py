@@ -3,19 +3,92 @@ Blazegraph graph database connector implementation for MedKnowBridge.
 Provides a persistent storage solution using Blazegraph.
 """
 
+import copy
+import hashlib
 import os
 import logging
+import threading
 import requests
 import re
-from typing import Dict, Any, Optional, Tuple, List
+import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, Optional, Tuple, List
 import rdflib
 from rdflib import Graph, URIRef, Literal, Namespace, BNode, RDF, RDFS, OWL
 from pymantic import sparql
 
 from .interface import GraphDatabaseInterface
 
+# Optional incremental JSON parser: without it a streamed response is parsed in one piece
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
+# Connections kept alive per connector session, and retries of idempotent requests on gateway errors
+HTTP_POOL_MAXSIZE = 16
+HTTP_MAX_RETRIES = 3
+
+# Seconds a successful connection check is trusted before is_connected probes the server again
+CONNECTION_PROBE_TTL = 5.0
+
+# Maximum number of SELECT results kept by execute_query, and seconds each one stays valid
+QUERY_CACHE_SIZE = 256
+QUERY_CACHE_TTL = 60.0
+
+# Concepts per VALUES clause when loading relationships, and batches queried at once
+RELATIONSHIP_BATCH_SIZE = 500
+RELATIONSHIP_QUERY_WORKERS = 4
+
+def _create_session(base_url: str) -> requests.Session:
+    """
+    Creates an HTTP session that reuses connections to a Blazegraph server.
+    
+    Args:
+        base_url: Base URL of the Blazegraph server
+        
+    Returns:
+        requests.Session with a pooled, retrying adapter mounted on base_url
+    """
+    session = requests.Session()
+    # Retry's default allowed methods exclude POST, so updates are never sent twice;
+    # raise_on_status=False keeps returning the last response for status checks
+    retry = Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry)
+    session.mount(base_url, adapter)
+    return session
+
+# Graph statistics as (result variable, aggregate, graph pattern), combined into one query
+_STATISTICS_QUERIES: Tuple[Tuple[str, str, str], ...] = (
+    ("numConcepts", "(COUNT(DISTINCT ?concept) AS ?numConcepts)",
+     "?concept a owl:Class ."),
+    ("numRelationships", "(COUNT(DISTINCT ?relationship) AS ?numRelationships)",
+     "?relationship a owl:ObjectProperty ."),
+    ("numClasses", "(COUNT(DISTINCT ?class) AS ?numClasses)",
+     "?class a owl:Class . FILTER(!isBlank(?class))"),
+    ("numSubclasses", "(COUNT(?subclass) AS ?numSubclasses)",
+     "?subclass rdfs:subClassOf ?superclass . ?subclass a owl:Class . ?superclass a owl:Class . "
+     "FILTER(?subclass != ?superclass) FILTER(!isBlank(?subclass)) FILTER(!isBlank(?superclass))"),
+    ("numAnnotations", "(COUNT(?s) AS ?numAnnotations)",
+     "?s ?p ?o . ?p a owl:AnnotationProperty ."),
+    ("numAxioms", "(COUNT(?s) AS ?numAxioms)",
+     "{ ?s owl:equivalentClass ?o } UNION { ?s owl:disjointWith ?o } UNION "
+     "{ ?s owl:complementOf ?o } UNION { ?s owl:intersectionOf ?o } UNION { ?s owl:unionOf ?o }"),
+    ("numProperties", "(COUNT(DISTINCT ?property) AS ?numProperties)",
+     "{ ?property a owl:ObjectProperty } UNION { ?property a owl:DatatypeProperty } UNION "
+     "{ ?property a owl:AnnotationProperty }"),
+)
+
 class BlazegraphConnectionError(Exception):
     """Exception raised for connection errors."""
     pass
@@ -23,9 +96,9 @@ class BlazegraphConnectionError(Exception):
 class BlazegraphNamespaceManager:
     """Manager for Blazegraph namespace administration via REST API."""
     
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, session: Optional[requests.Session] = None):
         self.base_url = base_url
-        self._session = requests.Session()
+        self._session = session if session is not None else _create_session(base_url)
         
     def create_namespace(self, name: str) -> bool:
         """
@@ -93,9 +166,20 @@ class BlazegraphConnector(GraphDatabaseInterface):
         self.base_url = base_url
         self.namespace = namespace
         self.connected = False
+        # Monotonic time of the last successful connection check, trusted for _probe_ttl seconds
+        self._last_probe_ts = 0.0
+        self._probe_ttl = CONNECTION_PROBE_TTL
+        # Query results by digest of the query string, with the monotonic time they expire
+        self._query_cache: "OrderedDict[bytes, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        self._query_cache_hits = 0
+        self._query_cache_misses = 0
+        # One pooled session for every REST call, so requests reuse the same keep-alive connections
+        self._session = _create_session(base_url)
         # Initialize namespace manager with proper arguments
         self._namespace_manager = BlazegraphNamespaceManager(
-            base_url=base_url
+            base_url=base_url,
+            session=self._session
         )
         
         # Initialize the SPARQL server with proper namespace bindings
@@ -128,7 +212,7 @@ class BlazegraphConnector(GraphDatabaseInterface):
         try:
             # Test connection by checking namespace
             url = f"{self.base_url}/namespace/{self.namespace}/sparql"
-            response = requests.get(url)
+            response = self._session.get(url)
             if response.status_code == 200:
                 self.connected = True
                 logger.info(f"[{self.namespace}] Connected to Blazegraph")
@@ -160,7 +244,9 @@ class BlazegraphConnector(GraphDatabaseInterface):
             DELETE WHERE { ?s ?p ?o }
             """
             
-            response = requests.post(url, headers=headers, data=update_query)
+            response = self._session.post(url, headers=headers, data=update_query)
+            # Cached results are stale once the update was sent, whatever its status
+            self.invalidate_query_cache()
             response.raise_for_status()
             
             logger.info(f"[{self.namespace}] Cleared database namespace")
@@ -180,7 +266,7 @@ class BlazegraphConnector(GraphDatabaseInterface):
         try:
             # Test connection by checking namespace
             url = f"{self.base_url}/namespace/{self.namespace}/sparql"
-            response = requests.get(url)
+            response = self._session.get(url)
             if response.status_code == 200:
                 self.connected = True
                 return True
@@ -305,12 +391,16 @@ class BlazegraphConnector(GraphDatabaseInterface):
             logger.error(f"[{self.namespace}] Unexpected error creating namespace '{name}': {e}")
             raise Exception(f"Failed to create namespace: {e}")
 
-    def execute_query(self, query: str) -> List[Dict[str, Any]]:
+    def execute_query(self, query: str, bypass_cache: bool = False) -> List[Dict[str, Any]]:
         """
         Executes a SPARQL query against Blazegraph.
         
+        Results are cached for QUERY_CACHE_TTL seconds per query string; the cache is
+        emptied whenever this connector writes to the namespace.
+        
         Args:
             query: SPARQL query string
+            bypass_cache: Always query the server (the fresh result is still cached)
             
         Returns:
             List of dictionaries containing query results
@@ -319,45 +409,185 @@ class BlazegraphConnector(GraphDatabaseInterface):
             BlazegraphConnectionError: If connection fails
             Exception: For other unexpected errors
         """
+        cache_key = hashlib.blake2b(query.encode("utf-8"), digest_size=16).digest()
+        if not bypass_cache:
+            cached = self._get_cached_query(cache_key)
+            if cached is not None:
+                logger.debug(f"[{self.namespace}] Query result served from cache")
+                return cached
+        
         try:
-            if not self.is_connected():
-                raise BlazegraphConnectionError("Not connected to Blazegraph")
+            results = list(self._stream_bindings(query))
+        except Exception as e:
+            raise self._query_error(e, query)
+        
+        if results:
+            logger.info(f"[{self.namespace}] Query returned {len(results)} results")
+        else:
+            logger.info(f"[{self.namespace}] Query returned no results")
+        self._cache_query(cache_key, results)
+        return results
+
+    def execute_query_iter(self, query: str) -> Iterator[Dict[str, Any]]:
+        """
+        Executes a SPARQL query against Blazegraph, yielding the results one at a time.
+        
+        Results are converted while the response is read, so large result sets are never
+        held in full; they are not cached.
+        
+        Args:
+            query: SPARQL query string
             
-            logger.debug(f"[{self.namespace}] Executing query: {query}")
-            # Execute query with UTF-8 encoding
-            headers = {'Accept': 'application/sparql-results+json; charset=utf-8'}
-            result = self.sparql_server.query(query, headers=headers)
+        Yields:
+            Dictionaries with the same form as the items returned by execute_query
             
-            if not result or not result['results'] or not result['results']['bindings']:
-                logger.info(f"[{self.namespace}] Query returned no results")
-                return []
+        Raises:
+            BlazegraphConnectionError: If connection fails
+            Exception: For other unexpected errors
+        """
+        try:
+            yield from self._stream_bindings(query)
+        except Exception as e:
+            raise self._query_error(e, query)
+
+    def _stream_bindings(self, query: str) -> Iterator[Dict[str, Any]]:
+        """
+        Sends a SPARQL query over the pooled session and converts the bindings as they are parsed.
+        
+        Args:
+            query: SPARQL query string
             
-            logger.info(f"[{self.namespace}] Query returned {len(result['results']['bindings'])} results")
+        Yields:
+            Converted result bindings
+        """
+        if not self.is_connected():
+            raise BlazegraphConnectionError("Not connected to Blazegraph")
+        
+        logger.debug(f"[{self.namespace}] Executing query: {query}")
+        url = f"{self.base_url}/namespace/{self.namespace}/sparql"
+        # Execute query with UTF-8 encoding; POST keeps long queries out of the URL
+        headers = {'Accept': 'application/sparql-results+json; charset=utf-8'}
+        with self._session.post(url, data={'query': query}, headers=headers, stream=True) as response:
+            response.raise_for_status()
+            # An answered query proves the connection as well as a probe would
+            self._last_probe_ts = time.monotonic()
             
-            # Convert all string values to ensure UTF-8 encoding
-            results = []
-            for binding in result['results']['bindings']:
-                converted = {}
-                for key, value in binding.items():
-                    if isinstance(value, dict) and 'value' in value:
-                        # Convert string values to ensure UTF-8 encoding
-                        converted_value = str(value['value'])
-                        converted[key] = {
-                            'type': value['type'],
-                            'value': converted_value
-                        }
-                    else:
-                        converted[key] = value
-                results.append(converted)
-            return results
+            if ijson is not None:
+                # Parse the (decompressed) body incrementally, one binding at a time
+                response.raw.decode_content = True
+                bindings = ijson.items(response.raw, 'results.bindings.item')
+            else:
+                result = response.json()
+                bindings = ((result or {}).get('results') or {}).get('bindings') or ()
             
-        except BlazegraphConnectionError as e:
-            logger.error(f"[{self.namespace}] Connection error executing query: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"[{self.namespace}] Error executing query: {e}", exc_info=True)
-            logger.debug(f"[{self.namespace}] Query that failed: {query}")
-            raise Exception(f"Query execution failed: {e}")
+            for binding in bindings:
+                yield self._convert_binding(binding)
+
+    @staticmethod
+    def _convert_binding(binding: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Converts one SPARQL JSON result binding to a dictionary of type/value pairs.
+        
+        Args:
+            binding: Binding from the results.bindings array
+            
+        Returns:
+            Dictionary mapping each variable to its type and string value
+        """
+        converted = {}
+        for key, value in binding.items():
+            if isinstance(value, dict) and 'value' in value:
+                # Convert string values to ensure UTF-8 encoding
+                converted[key] = {
+                    'type': value['type'],
+                    'value': str(value['value'])
+                }
+            else:
+                converted[key] = value
+        return converted
+
+    def _query_error(self, error: Exception, query: str) -> Exception:
+        """
+        Logs a failed query and gets the exception to raise for it.
+        
+        Args:
+            error: Exception raised while executing the query
+            query: SPARQL query string
+            
+        Returns:
+            The connection error itself, or a generic query execution error
+        """
+        if isinstance(error, BlazegraphConnectionError):
+            logger.error(f"[{self.namespace}] Connection error executing query: {error}")
+            return error
+        if isinstance(error, requests.RequestException):
+            # Drop the cached connection state so the next call probes the server again
+            self.connected = False
+            self._last_probe_ts = 0.0
+            logger.error(f"[{self.namespace}] HTTP error executing query: {error}")
+        else:
+            logger.error(f"[{self.namespace}] Error executing query: {error}", exc_info=True)
+        logger.debug(f"[{self.namespace}] Query that failed: {query}")
+        return Exception(f"Query execution failed: {error}")
+
+    def _get_cached_query(self, key: bytes) -> Optional[List[Dict[str, Any]]]:
+        """
+        Gets a copy of a cached query result that has not expired.
+        
+        Args:
+            key: Digest of the query string
+            
+        Returns:
+            Copy of the cached result, or None if absent or expired
+        """
+        with self._query_cache_lock:
+            entry = self._query_cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._query_cache.move_to_end(key)
+                self._query_cache_hits += 1
+            else:
+                if entry is not None:
+                    del self._query_cache[key]
+                self._query_cache_misses += 1
+                return None
+        # Copies keep the cached result intact when callers modify the bindings
+        return copy.deepcopy(entry[1])
+
+    def _cache_query(self, key: bytes, results: List[Dict[str, Any]]) -> None:
+        """
+        Stores a query result, evicting the least recently used one when full.
+        
+        Args:
+            key: Digest of the query string
+            results: Query result to cache
+        """
+        entry = (time.monotonic() + QUERY_CACHE_TTL, copy.deepcopy(results))
+        with self._query_cache_lock:
+            self._query_cache[key] = entry
+            self._query_cache.move_to_end(key)
+            if len(self._query_cache) > QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+
+    def invalidate_query_cache(self) -> None:
+        """
+        Drops all cached query results, e.g. after the namespace was changed by another client.
+        """
+        with self._query_cache_lock:
+            self._query_cache.clear()
+
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        Gets the query cache counters.
+        
+        Returns:
+            Dictionary with the number of cache hits, misses and cached results
+        """
+        with self._query_cache_lock:
+            return {
+                "hits": self._query_cache_hits,
+                "misses": self._query_cache_misses,
+                "size": len(self._query_cache),
+            }
 
     def connect(self) -> bool:
         """
@@ -385,6 +615,7 @@ class BlazegraphConnector(GraphDatabaseInterface):
             if result and result['results']['bindings']:
                 logger.info(f"[{self.namespace}] Successfully connected to Blazegraph")
                 self.connected = True
+                self._last_probe_ts = time.monotonic()
                 return True
             
             logger.error(f"[{self.namespace}] Failed to connect to Blazegraph: empty response")
@@ -398,6 +629,9 @@ class BlazegraphConnector(GraphDatabaseInterface):
         """
         Checks if connected to the graph database.
         
+        A successful check is trusted for _probe_ttl seconds, so repeated calls
+        (one per query) do not each cost an HTTP round trip.
+        
         Returns:
             bool: True if connected, False otherwise
         """
@@ -407,12 +641,16 @@ class BlazegraphConnector(GraphDatabaseInterface):
                 logger.error(f"[{self.namespace}] No SPARQL server initialized")
                 return False
             
-            # Test connection by checking namespace
+            if self.connected and time.monotonic() - self._last_probe_ts < self._probe_ttl:
+                return True
+            
+            # Test connection by checking namespace; HEAD returns no service description body
             url = f"{self.base_url}/namespace/{self.namespace}/sparql"
-            response = requests.get(url)
+            response = self._session.head(url)
             if response.status_code == 200:
-                logger.info(f"[{self.namespace}] Successfully verified namespace connection")
+                logger.debug(f"[{self.namespace}] Successfully verified namespace connection")
                 self.connected = True
+                self._last_probe_ts = time.monotonic()
                 return True
             else:
                 logger.error(f"[{self.namespace}] Namespace not found or empty")
@@ -470,7 +708,10 @@ class BlazegraphConnector(GraphDatabaseInterface):
         try:
             # Clear any session state
             self.connected = False
+            self._last_probe_ts = 0.0
             self.sparql_server = None
+            # Release the pooled connections; the session reopens them if used again
+            self._session.close()
             logger.info(f"[{self.namespace}] Disconnected from Blazegraph")
             return True
         except Exception as e:
@@ -646,6 +887,9 @@ class BlazegraphConnector(GraphDatabaseInterface):
         """
         Carrega os relacionamentos para uma lista de conceitos.
         
+        Os conceitos são consultados em lotes de RELATIONSHIP_BATCH_SIZE, para que o
+        corpo de cada consulta continue pequeno; vários lotes são enviados em paralelo.
+        
         Args:
             concepts: Lista de conceitos para carregar relacionamentos
         """
@@ -653,32 +897,24 @@ class BlazegraphConnector(GraphDatabaseInterface):
         if not concepts:
             return
             
-        try:
-            # Construir uma lista de IDs de conceitos para a consulta
-            concept_ids = [f"<{concept['id']}>" for concept in concepts]
-            concept_ids_str = " ".join(concept_ids)
-            
-            # Consulta para buscar relacionamentos
-            query = f"""
-            SELECT ?subject ?predicate ?object
-            WHERE {{
-                VALUES ?subject {{ {concept_ids_str} }}
-                ?subject ?predicate ?object .
-                FILTER(?predicate != rdf:type)
-            }}
-            """
-            
-            results = self.execute_query(query)
-            
-            if not results or not results['results'] or not results['results']['bindings']:
-                logger.info(f"[{self.namespace}] No relationships found for concepts")
-                return
-                
-            # Mapear conceitos por ID para facilitar a atualização
-            concept_map = {concept["id"]: concept for concept in concepts}
-            
-            # Processar relacionamentos
-            for res in results['results']['bindings']:
+        # Mapear conceitos por ID para facilitar a atualização
+        concept_map = {concept["id"]: concept for concept in concepts}
+        batches = [
+            concepts[start:start + RELATIONSHIP_BATCH_SIZE]
+            for start in range(0, len(concepts), RELATIONSHIP_BATCH_SIZE)
+        ]
+        
+        # As consultas esperam pela rede, então threads as sobrepõem sobre a sessão compartilhada
+        if len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(batches), RELATIONSHIP_QUERY_WORKERS)) as executor:
+                batch_results = list(executor.map(self._query_relationships, batches))
+        else:
+            batch_results = [self._query_relationships(batches[0])]
+        
+        found = 0
+        # Processar relacionamentos na thread atual, na ordem dos lotes
+        for results in batch_results:
+            for res in results:
                 subject_id = self._extract_value(res, "subject")
                 predicate = self._extract_value(res, "predicate")
                 object_id = self._extract_value(res, "object")
@@ -697,20 +933,43 @@ class BlazegraphConnector(GraphDatabaseInterface):
                         "predicate_name": predicate_name,
                         "object": object_id
                     }
-                    concept_map[subject_id]["relationships"].append(relationship)
-                    
-        except Exception as e:
-            logger.error(f"[{self.namespace}] Error loading relationships: {e}", exc_info=True)
+                    concept_map[subject_id].setdefault("relationships", []).append(relationship)
+                    found += 1
+        
+        if not found:
+            logger.info(f"[{self.namespace}] No relationships found for concepts")
+
+    def _query_relationships(self, concepts) -> List[Dict[str, Any]]:
+        """
+        Consulta os relacionamentos de um lote de conceitos.
+        
+        Args:
+            concepts: Lote de conceitos
             
+        Returns:
+            Lista de bindings com subject, predicate e object (vazia se a consulta falhar)
+        """
+        # Construir uma lista de IDs de conceitos para a consulta
+        concept_ids_str = " ".join(f"<{concept['id']}>" for concept in concepts)
+        
+        # Consulta para buscar relacionamentos
+        query = f"""
+            SELECT ?subject ?predicate ?object
+            WHERE {{
+                VALUES ?subject {{ {concept_ids_str} }}
+                ?subject ?predicate ?object .
+                FILTER(?predicate != rdf:type)
+            }}
+            """
+        
+        try:
+            return self.execute_query(query)
         except Exception as e:
-            logger.error(f"[{self.namespace}] Error executing concept query: {e}", exc_info=True)
-            logger.debug(f"[{self.namespace}] Query that failed: {query}")
-            logger.error(f"Error retrieving concepts: {e}")
+            logger.error(f"[{self.namespace}] Error loading relationships: {e}", exc_info=True)
             return []
 
     def get_statistics(self) -> Dict[str, int]:
         """
-{{ ... }}
         Retrieves statistics about the graph.
         
         Returns:
@@ -722,102 +981,31 @@ class BlazegraphConnector(GraphDatabaseInterface):
                 if not self.connect():
                     return {}
 
-            # Query for total triples
-            query_total = """
-            SELECT (COUNT(*) as ?totalTriples)
-            WHERE {
-                ?s ?p ?o .
-            }
-            """
-
-            # Query for number of concepts
-            query_concepts = """
-            SELECT (COUNT(DISTINCT ?concept) as ?numConcepts)
-            WHERE {
-                ?concept a owl:Class .
-            }
-            """
-
-            # Query for number of relationships
-            query_relationships = """
-            SELECT (COUNT(DISTINCT ?relationship) as ?numRelationships)
-            WHERE {
-                ?relationship a owl:ObjectProperty .
-            }
-            """
-            
-            # Query for number of classes
-            query_classes = """
-            SELECT (COUNT(DISTINCT ?class) as ?numClasses)
-            WHERE {
-                ?class a owl:Class .
-                FILTER(!isBlank(?class))
-            }
-            """
+            # All counts come from one query: each sub-SELECT is an independent aggregate
+            # returning one row, so their join is the single row with every count
+            subqueries = "\n".join(
+                f"{{ SELECT {projection} WHERE {{ {pattern} }} }}"
+                for _, projection, pattern in _STATISTICS_QUERIES
+            )
+            variables = " ".join(f"?{key}" for key, _, _ in _STATISTICS_QUERIES)
+            query = f"SELECT {variables}\nWHERE {{\n{subqueries}\n}}"
             
-            # Query for number of subclasses
-            query_subclasses = """
-            SELECT (COUNT(?subclass) as ?numSubclasses)
-            WHERE {
-                ?subclass rdfs:subClassOf ?superclass .
-                ?subclass a owl:Class .
-                ?superclass a owl:Class .
-                FILTER(?subclass != ?superclass)
-                FILTER(!isBlank(?subclass))
-                FILTER(!isBlank(?superclass))
-            }
-            """
-            
-            # Query for number of annotations
-            query_annotations = """
-            SELECT (COUNT(?s) as ?numAnnotations)
-            WHERE {
-                ?s ?p ?o .
-                ?p a owl:AnnotationProperty .
-            }
-            """
-            
-            # Query for number of axioms
-            query_axioms = """
-            SELECT (COUNT(?s) as ?numAxioms)
-            WHERE {
-                { ?s owl:equivalentClass ?o } UNION
-                { ?s owl:disjointWith ?o } UNION
-                { ?s owl:complementOf ?o } UNION
-                { ?s owl:intersectionOf ?o } UNION
-                { ?s owl:unionOf ?o }
-            }
-            """
-            
-            # Query for number of properties
-            query_properties = """
-            SELECT (COUNT(DISTINCT ?property) as ?numProperties)
-            WHERE {
-                { ?property a owl:ObjectProperty } UNION
-                { ?property a owl:DatatypeProperty } UNION
-                { ?property a owl:AnnotationProperty }
-            }
-            """
-
-            # Execute queries
             results = {}
-            for query, key in [
-                (query_total, 'totalTriples'),
-                (query_concepts, 'numConcepts'),
-                (query_relationships, 'numRelationships'),
-                (query_classes, 'numClasses'),
-                (query_subclasses, 'numSubclasses'),
-                (query_annotations, 'numAnnotations'),
-                (query_axioms, 'numAxioms'),
-                (query_properties, 'numProperties')
-            ]:
-                try:
-                    result = self.sparql_server.query(query)
-                    if result and result['results'] and result['results']['bindings']:
-                        results[key] = int(result['results']['bindings'][0][key]['value'])
-                except Exception as e:
-                    logger.warning(f"[{self.namespace}] Error executing query for {key}: {e}")
-                    results[key] = 0
+            try:
+                rows = self.execute_query(query)
+                if rows:
+                    for key, _, _ in _STATISTICS_QUERIES:
+                        results[key] = int(self._extract_value(rows[0], key) or 0)
+            except Exception as e:
+                # Fall back to one query per count, so one failing count does not hide the others
+                logger.warning(f"[{self.namespace}] Combined statistics query failed, querying counts separately: {e}")
+                for key, projection, pattern in _STATISTICS_QUERIES:
+                    try:
+                        rows = self.execute_query(f"SELECT {projection} WHERE {{ {pattern} }}")
+                        results[key] = int(self._extract_value(rows[0], key) or 0) if rows else 0
+                    except Exception as e:
+                        logger.warning(f"[{self.namespace}] Error executing query for {key}: {e}")
+                        results[key] = 0
 
             # Calculate relationships count
             relationships_count = results.get('numRelationships', 0)
@@ -993,8 +1181,9 @@ class BlazegraphConnector(GraphDatabaseInterface):
             }}
             """
             
-            # Send the data
-            response = requests.post(url, headers=headers, data=query)
+            # Send the data; cached results are stale once the update was sent
+            response = self._session.post(url, headers=headers, data=query)
+            self.invalidate_query_cache()
             
             if response.status_code == 200:
                 logger.info(f"[{self.namespace}] Successfully imported {len(graph)} triples")
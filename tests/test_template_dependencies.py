@@ -0,0 +1,105 @@
+"""Dependency checks on delete and export, run against the bundled templates."""
+
+import os
+import shutil
+
+import pytest
+import streamlit as st
+
+from prompt.editor_manager import EditorManager
+from prompt.export_manager import ExportManager
+from prompt.template_manager import TemplateManager
+
+
+class FakeLLM:
+    """LLM stub that reports the given template IDs as dependencies."""
+
+    model_name = "fake"
+
+    def __init__(self, dependencies=None):
+        self.dependencies = dependencies or []
+        self.prompts = []
+
+    def generate_structured(self, prompt, *args, **kwargs):
+        self.prompts.append(prompt)
+        return {"dependencies": self.dependencies, "warnings": ["Used by other templates"]}
+
+    def generate_text(self, prompt, *args, **kwargs):
+        return prompt
+
+    def generate_embeddings(self, text):
+        return [0.0]
+
+
+BUNDLED_TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "prompt", "templates")
+
+
+@pytest.fixture
+def template_manager(tmp_path, monkeypatch):
+    # Copies of the bundled templates, so the loader's cache files stay out of the source tree
+    templates_dir = tmp_path / "templates"
+    shutil.copytree(BUNDLED_TEMPLATES_DIR, templates_dir, ignore=shutil.ignore_patterns(".cache"))
+    monkeypatch.setattr(TemplateManager, "_templates_dir", str(templates_dir))
+    st.session_state.clear()
+    manager = TemplateManager(FakeLLM(), skip_intent_analysis=True)
+    yield manager
+    st.session_state.clear()
+
+
+def test_bundled_templates_have_no_structural_references(template_manager):
+    assert template_manager.get_template("care_plan") is not None
+    assert template_manager.get_dependents("care_plan") == []
+
+
+def test_structural_reference_to_bundled_template(template_manager):
+    template_manager.create_template({
+        "id": "care_plan_summary",
+        "name": "Care Plan Summary",
+        "type": "text",
+        "content": "Summarize:\n{{template:care_plan}}",
+        "variables": [],
+    })
+
+    assert template_manager.get_dependents("care_plan") == ["care_plan_summary"]
+    with pytest.raises(Warning):
+        EditorManager(FakeLLM(), template_manager).delete_template("care_plan", use_llm=False)
+    assert template_manager.exists("care_plan")
+
+
+def test_delete_asks_llm_by_default(template_manager):
+    llm = FakeLLM(dependencies=["concept_explanation"])
+
+    with pytest.raises(Warning):
+        EditorManager(llm, template_manager).delete_template("care_plan")
+    assert llm.prompts
+    assert template_manager.exists("care_plan")
+
+
+def test_export_asks_llm_by_default(template_manager):
+    llm = FakeLLM(dependencies=["concept_explanation", "missing_template"])
+
+    dependencies = ExportManager(llm, template_manager)._get_dependencies("care_plan")
+
+    assert [template["id"] for template in dependencies] == ["concept_explanation"]
+
+
+def test_reimport_updates_existing_template(template_manager):
+    export_manager = ExportManager(FakeLLM(), template_manager)
+    export_data = export_manager.export_template("care_plan", include_dependencies=False)
+    export_data["template"] = dict(export_data["template"], name="Care Plan v2")
+
+    export_manager.import_template(export_data)
+
+    assert [t["id"] for t in template_manager.templates].count("care_plan") == 1
+    assert template_manager.get_template("care_plan")["name"] == "Care Plan v2"
+
+
+def test_create_template_rejects_existing_id(template_manager):
+    with pytest.raises(ValueError):
+        template_manager.create_template({
+            "id": "care_plan",
+            "name": "Duplicate",
+            "type": "text",
+            "content": "x",
+            "variables": [],
+        })
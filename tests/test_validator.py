@@ -0,0 +1,49 @@
+"""Validation memo of PromptValidator."""
+
+import datetime
+import uuid
+
+import pytest
+from jsonschema.exceptions import ValidationError
+
+from prompt.validator import PromptValidator
+
+
+def make_template(template_id):
+    return {
+        "template_id": template_id,
+        "description": "Explains a concept",
+        "template": "Explain {concept_name}",
+        "parameters": {
+            "concept_name": {"type": "string", "description": "Concept name", "required": True},
+        },
+    }
+
+
+def test_date_template_id_is_rejected_after_equal_looking_string():
+    validator = PromptValidator()
+    validator.validate_template(make_template("2024-01-01"))
+
+    # Unquoted "template_id: 2024-01-01" in YAML loads as a date
+    with pytest.raises(ValidationError):
+        validator.validate_template(make_template(datetime.date(2024, 1, 1)))
+
+
+def test_uuid_template_id_is_rejected_after_equal_looking_string():
+    template_id = uuid.uuid4()
+    validator = PromptValidator()
+    validator.validate_template(make_template(str(template_id)))
+
+    with pytest.raises(ValidationError):
+        validator.validate_template(make_template(template_id))
+
+
+def test_tuple_parameters_are_not_memoized_as_list():
+    validator = PromptValidator()
+    template = make_template("with_examples")
+    template["examples"] = [{"concept_name": "Asthma"}]
+    validator.validate_template(template)
+
+    template["examples"] = ({"concept_name": "Asthma"},)
+    with pytest.raises(ValidationError):
+        validator.validate_template(template)